@@ -1,127 +1,92 @@
 import streamlit as st
 import pandas as pd
-import plotly.graph_objects as go
-from Data import (
-    telugu_letters, mul, div, CSUB, CVFMAE, meaning_map,
-    good_areas, letter_range_rashi_dynamic
-)
 from style import load_custom_styles
+import metrics
+from metrics import timed, cache_call, cache_miss
+from vastu import (
+    telugu_letters, VARGA_KEYS, Verdict, AreaSearch, DimensionSearch, SCORED_VARGAS, calculate_vastu,
+    is_good_area, nearest_good_area_above, nearest_good_area_below,
+    lookup_letter_value, calculate_money_expense,
+    MAX_COMPARE_AREAS, parse_areas, compare_areas, comparison_summary, warn_meaning_issues
+)
+from vastu.charts import create_comparison_heatmap, create_radar_chart_plotly, update_radar_figure
+from vastu.tables import letter_groups_html, money_expense_html, vastu_table_html
+from vastu.store import ReportStore
 
 # -----------------------------
-# Load custom CSS styles
+# Page Config
 # -----------------------------
-load_custom_styles()
+st.set_page_config(page_title="🛕 తెలుగు వాస్తు షోడశవర్గులు", layout="wide")
+
+metrics.count_rerun()
+metrics.start_metrics_server()
 
 # -----------------------------
-# Page Config
+# Load custom CSS styles
 # -----------------------------
-st.set_page_config(page_title="🛕 తెలుగు వాస్తు షోడశవర్గులు", layout="wide")
+with timed("load_custom_styles"):
+    load_custom_styles()
+
 st.markdown('<div class="main-title">🛕 తెలుగు వాస్తు - షోడశ వర్గాలు</div>', unsafe_allow_html=True)
 
 # -----------------------------
-# Helper Functions
-# -----------------------------
-def lookup_letter_value(letter):
-    return telugu_letters.get(letter, 0)
-
-def calculate_money_expense(v_val, n_val):
-    v_minus = v_val - CSUB
-    n_minus = n_val - CSUB
-    Money = v_minus if v_minus != 0 else 52
-    Person_Name = n_minus if n_minus != 0 else 52
-    money_concat = int(f"{Money}{Person_Name}")
-    expense_concat = int(f"{Person_Name}{Money}")
-    Money_Value = money_concat % CVFMAE
-    Expense_Value = expense_concat % CVFMAE
-    return Money_Value, Expense_Value
-
-def calculate_vastu(area):
-    results = {}
-    for key in mul.keys():
-        computed = (area * mul[key]) % div[key]
-        results[key] = computed if computed != 0 else div[key]
-    return results
-
-def style_vastu(row):
-    if row['Verdict'] == 'మంచిది':
-        return ['background-color: #c6f5d3'] * len(row)
-    elif row['Verdict'] == 'మంచిదికాదు':
-        return ['background-color: #f5c6c6'] * len(row)
-    else:
-        return ['background-color: #f0f0f0'] * len(row)
-
-def create_radar_chart_plotly(vastu_results):
-    categories = [key.capitalize() for key in vastu_results.keys()]
-    values = [vastu_results[key] for key in vastu_results.keys()]
-    values += values[:1]
-
-    colors = []
-    for key in vastu_results.keys():
-        meaning = meaning_map.get(key, {}).get(vastu_results[key], "")
-        if "మంచిదికాదు" in meaning:
-            colors.append('red')
-        elif "మంచిది" in meaning:
-            colors.append('green')
-        else:
-            colors.append('grey')
-    colors += colors[:1]
-
-    fig = go.Figure()
-    fig.add_trace(go.Scatterpolar(
-        r=values,
-        theta=categories + [categories[0]],
-        fill='toself',
-        line_color='blue',
-        fillcolor='rgba(0,0,255,0.1)',
-        hovertemplate='%{theta}: %{r}<extra></extra>'
-    ))
-
-    for i, val in enumerate(values[:-1]):
-        fig.add_trace(go.Scatterpolar(
-            r=[val],
-            theta=[categories[i]],
-            mode='markers',
-            marker=dict(color=colors[i], size=10),
-            showlegend=False,
-            hovertemplate=f"{categories[i]}: {val}<extra></extra>"
-        ))
-
-    fig.update_layout(
-        polar=dict(radialaxis=dict(visible=True, range=[0, max(div.values())])),
-        showlegend=False,
-        margin=dict(l=20, r=20, t=20, b=20),
-        height=350,
-        width=400
-    )
-    return fig
-
-def get_letter_group_info(selected_letter):
-    """
-    Returns letters grouped together, with their Rashi and Nakshatram
-    """
-    if selected_letter not in letter_range_rashi_dynamic:
-        return []
-
-    result = []
-    groups = letter_range_rashi_dynamic[selected_letter]
-
-    for group in groups:
-        result.append({
-            "Letters": ", ".join(group["Letters"]),
-            "Rashi": group["Rashi"],
-            "Nakshatram": group["Nakshatram"]
-        })
-    return result
+# Cached Tables & Computations
+# -----------------------------
+CACHE_MAX_ENTRIES = 2048
+CACHE_TTL = 60 * 60
+
+@st.cache_resource
+def load_report_store():
+    return ReportStore()
+
+# Runs once per server process, so the meaning table issues are logged once
+@st.cache_resource
+def report_meaning_issues():
+    warn_meaning_issues()
+
+report_meaning_issues()
+
+@st.cache_resource
+def load_letter_options():
+    return list(telugu_letters.keys())
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL)
+def compute_vastu_report(area):
+    return {
+        "vastu_results": calculate_vastu(area),
+        "vastu_html": vastu_table_html(area),
+    }
+
+@st.cache_data(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL)
+def compute_money_html(village_letter, person_letter):
+    cache_miss("compute_money_html")
+    v_val = lookup_letter_value(village_letter)
+    n_val = lookup_letter_value(person_letter)
+    Money_Value, Expense_Value = calculate_money_expense(v_val, n_val)
+    return money_expense_html(Money_Value, Expense_Value)
+
+# The radar depends on the area alone, so it is shared by every letter pair.
+# It is returned as a shared object and must not be mutated.
+@st.cache_resource
+def load_radar_base_figure():
+    return create_radar_chart_plotly({key: 0 for key in VARGA_KEYS}).to_dict()
+
+@st.cache_resource(max_entries=CACHE_MAX_ENTRIES, ttl=CACHE_TTL)
+def build_radar_figure(area):
+    cache_miss("build_radar_figure")
+    return update_radar_figure(load_radar_base_figure(), compute_vastu_report(area)["vastu_results"])
 
 # -----------------------------
 # Input Section
 # -----------------------------
+letter_options = load_letter_options()
+
 with st.form("input_form"):
     c1, c2, c3, c4 = st.columns([1,1,1,1])
     with c1:
-        village_letter = st.selectbox("🏡 గ్రామం మొదటి అక్షరం", list(telugu_letters.keys()))
+        village_letter = st.selectbox("🏡 గ్రామం మొదటి అక్షరం", letter_options)
     with c2:
-        person_letter = st.selectbox("👤 వ్యక్తి పేరు మొదటి అక్షరం", list(telugu_letters.keys()))
+        person_letter = st.selectbox("👤 వ్యక్తి పేరు మొదటి అక్షరం", letter_options)
     with c3:
         area = st.number_input("📏 స్థల పరిమాణం (sq. ft)", min_value=1, step=1)
     with c4:
@@ -134,57 +99,241 @@ with st.form("input_form"):
         """, unsafe_allow_html=True)
         calc = st.form_submit_button("Calculate")
 
+# -----------------------------
+# Incremental Sections
+# -----------------------------
+# Each results section keeps the inputs it was computed from and its output
+# in st.session_state. A section is recomputed only when its inputs change;
+# otherwise the stored output is emitted again. Trying another area leaves
+# the letter sections untouched, and a letter change leaves the vastu ones.
+def section_output(name, inputs, compute):
+    sections = st.session_state.setdefault("report_sections", {})
+    entry = sections.get(name)
+    cache_call(f"section_{name}")
+    if entry is None or entry[0] != inputs:
+        cache_miss(f"section_{name}")
+        entry = sections[name] = (inputs, compute())
+    return entry[1]
+
+def compute_plot_info(area):
+    suggestions = [a for a in (nearest_good_area_below(area), nearest_good_area_above(area)) if a is not None]
+    return is_good_area(area), suggestions
+
+def compute_money_section(village_letter, person_letter):
+    cache_call("compute_money_html")
+    return compute_money_html(village_letter, person_letter)
+
+def compute_vastu_section(area):
+    cache_call("build_radar_figure")
+    return compute_vastu_report(area)["vastu_html"], build_radar_figure(area)
+
 # -----------------------------
 # Calculation Logic
 # -----------------------------
 if calc:
+    # The last submission stays on the page while other panels rerun the script
+    st.session_state["report_inputs"] = (village_letter, person_letter, area)
+    # The store only feeds the History panel; the sections below are computed
+    # from the cached engine lookups, not read back from it
+    with timed("report_store"):
+        load_report_store().record_view(village_letter, person_letter, area)
+
+if "report_inputs" in st.session_state:
+    village_letter, person_letter, area = st.session_state["report_inputs"]
 
     # 1️⃣ Plot Info
-    if area in good_areas:
-        st.success("✅ ఈ స్థల పరిమాణం మంచి క్షేత్రం (Good Plot)")
-    else:
-        st.info("ℹ️ స్థల పరిమాణం సాధారణ (Normal Plot)")
+    with timed("plot_info"):
+        good_plot, suggestions = section_output("plot_info", (area,), lambda: compute_plot_info(area))
+        if good_plot:
+            st.success("✅ ఈ స్థల పరిమాణం మంచి క్షేత్రం (Good Plot)")
+        else:
+            st.info("ℹ️ స్థల పరిమాణం సాధారణ (Normal Plot)")
+            if suggestions:
+                st.caption("దగ్గరలోని మంచి స్థల పరిమాణాలు: " + ", ".join(f"{a} sq. ft" for a in suggestions))
 
     # 2️⃣ Rashi / Nakshatra Table
-    letter_groups_info = get_letter_group_info(person_letter)
-    if letter_groups_info:
-        st.subheader(f"✨ '{person_letter}' అక్షరానికి సంబంధించిన రాశి & నక్షత్ర సమాచారము")
-        st.table(pd.DataFrame(letter_groups_info))
+    with timed("rashi_table"):
+        groups_html = section_output("rashi_table", (person_letter,), lambda: letter_groups_html(person_letter))
+        if groups_html:
+            st.subheader(f"✨ '{person_letter}' అక్షరానికి సంబంధించిన రాశి & నక్షత్ర సమాచారము")
+            st.markdown(groups_html, unsafe_allow_html=True)
 
     # 3️⃣ Money & Expense Values
-    v_val = lookup_letter_value(village_letter)
-    n_val = lookup_letter_value(person_letter)
-    Money_Value, Expense_Value = calculate_money_expense(v_val, n_val)
-
-    st.subheader("గ్రామంలో ఉంటే లాభమా లేక నష్టమా ?")
-    table_df = pd.DataFrame({
-        "Item": ["ధనం", "వ్యయం"],
-        "Value": [Money_Value, Expense_Value]
-    })
-    st.table(table_df)
+    with timed("money_table"):
+        money_html = section_output("money_table", (village_letter, person_letter),
+                                    lambda: compute_money_section(village_letter, person_letter))
+        st.subheader("గ్రామంలో ఉంటే లాభమా లేక నష్టమా ?")
+        st.markdown(money_html, unsafe_allow_html=True)
 
     # 4️⃣ Vastu Results Table + Radar Chart
+    with timed("vastu_section"):
+        vastu_html, radar_fig = section_output("vastu", (area,), lambda: compute_vastu_section(area))
+
     col_vastu_table, col_radar = st.columns([3, 2])
-    vastu_results = calculate_vastu(area)
-    vastu_items = []
-
-    for key in mul.keys():
-        val = vastu_results[key]
-        meaning = meaning_map.get(key, {}).get(val, "—")
-        verdict = "మంచిదికాదు" if "మంచిదికాదు" in meaning else ("మంచిది" if "మంచిది" in meaning else "-")
-        vastu_items.append({
-            "Vastu Item": key.capitalize(),
-            "Value": val,
-            "Meaning": meaning,
-            "Verdict": verdict
-        })
-
-    vastu_df = pd.DataFrame(vastu_items)
-    with col_vastu_table:
+    with col_vastu_table, timed("vastu_table"):
         st.subheader("స్థలంలో కట్టే ఇంటి కొలతలు (అడ్డము మరియు పొడవు) లెక్కించడం వల్ల వచ్చిన వాస్తు ఫలితాలు")
-        st.dataframe(vastu_df.style.apply(style_vastu, axis=1))
+        st.markdown(vastu_html, unsafe_allow_html=True)
 
-    with col_radar:
+    with col_radar, timed("radar"):
         st.subheader("షోడశ వర్గ ఫలితాల రాడార్ చార్ట్")
-        radar_fig = create_radar_chart_plotly(vastu_results)
+        metrics.figure_payload("radar_figure", radar_fig)
         st.plotly_chart(radar_fig, use_container_width=True)
+
+# -----------------------------
+# Reverse Search Panel
+# -----------------------------
+SEARCH_PAGE_SIZE = 50
+
+with st.expander("🔍 షరతులకు సరిపోయే స్థల పరిమాణాలు వెతకండి (Reverse Search)"):
+    with st.form("search_form"):
+        s1, s2 = st.columns(2)
+        with s1:
+            search_lo = st.number_input("కనిష్ఠ పరిమాణం (sq. ft)", min_value=1, value=1, step=1)
+        with s2:
+            search_hi = st.number_input("గరిష్ఠ పరిమాణం (sq. ft)", min_value=1, value=10000, step=1)
+        good_vargas = st.multiselect(
+            "మంచిది కావలసిన వర్గాలు",
+            list(VARGA_KEYS),
+            format_func=lambda key: key.capitalize()
+        )
+        good_only = st.checkbox("మంచి క్షేత్రాలు మాత్రమే (Good Plots only)")
+        search = st.form_submit_button("Search")
+
+    if search:
+        st.session_state["area_search"] = AreaSearch(
+            search_lo, search_hi,
+            verdicts={key: Verdict.GOOD for key in good_vargas},
+            good_only=good_only
+        )
+
+    area_search = st.session_state.get("area_search")
+    if area_search is not None:
+        page_count = area_search.page_count(SEARCH_PAGE_SIZE)
+        st.write(f"మొత్తం {len(area_search)} పరిమాణాలు దొరికాయి")
+        if page_count:
+            page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+            st.dataframe(
+                pd.DataFrame({"Area (sq. ft)": area_search.page(page - 1, SEARCH_PAGE_SIZE)}),
+                hide_index=True
+            )
+
+# -----------------------------
+# Dimension Search Panel
+# -----------------------------
+with st.expander("📐 మంచి అడ్డము × పొడవు జతలు వెతకండి (Width × Length Search)"):
+    with st.form("dimension_form"):
+        d1, d2, d3, d4 = st.columns(4)
+        with d1:
+            width = st.number_input("అడ్డము (ft)", min_value=1, value=30, step=1)
+        with d2:
+            width_tol = st.number_input("అడ్డము ± (ft)", min_value=0, value=5, step=1)
+        with d3:
+            length = st.number_input("పొడవు (ft)", min_value=1, value=40, step=1)
+        with d4:
+            length_tol = st.number_input("పొడవు ± (ft)", min_value=0, value=5, step=1)
+        dim_vargas = st.multiselect(
+            "లెక్కించవలసిన వర్గాలు",
+            list(SCORED_VARGAS),
+            default=list(SCORED_VARGAS),
+            format_func=lambda key: key.capitalize()
+        )
+        dim_min_score = st.slider("కనీసం మంచి వర్గాలు", 0, len(SCORED_VARGAS), 0)
+        dim_good_only = st.checkbox("మంచి క్షేత్రాలు మాత్రమే (Good Plots only)", key="dimension_good_only")
+        dimension_search = st.form_submit_button("Search")
+
+    if dimension_search:
+        st.session_state["dimension_search"] = DimensionSearch(
+            width - width_tol, width + width_tol,
+            length - length_tol, length + length_tol,
+            vargas=dim_vargas, min_score=dim_min_score, good_only=dim_good_only
+        )
+
+    dim_search = st.session_state.get("dimension_search")
+    if dim_search is not None:
+        page_count = dim_search.page_count(SEARCH_PAGE_SIZE)
+        st.write(f"మొత్తం {len(dim_search)} జతలు దొరికాయి")
+        if page_count:
+            page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1,
+                                   key="dimension_page")
+            st.dataframe(
+                pd.DataFrame(dim_search.page(page - 1, SEARCH_PAGE_SIZE),
+                             columns=["Width (ft)", "Length (ft)", "Area (sq. ft)", "Good Vargas"]),
+                hide_index=True
+            )
+
+# -----------------------------
+# Area Comparison Panel
+# -----------------------------
+with st.expander("📊 స్థల పరిమాణాలను పోల్చండి (Compare Areas)"):
+    with st.form("compare_form"):
+        compare_text = st.text_input(
+            f"స్థల పరిమాణాలు లేదా పరిధులు (ఉదా: 1089, 1200, 1300-1320; గరిష్ఠం {MAX_COMPARE_AREAS})"
+        )
+        compare = st.form_submit_button("Compare")
+
+    if compare:
+        try:
+            compare_areas_list = parse_areas(compare_text)
+        except ValueError as exc:
+            st.error(str(exc))
+        else:
+            with timed("compare"):
+                values, verdicts = compare_areas(compare_areas_list)
+                st.session_state["area_comparison"] = (
+                    create_comparison_heatmap(compare_areas_list, values, verdicts).to_dict(),
+                    pd.DataFrame(comparison_summary(compare_areas_list, verdicts)),
+                )
+
+    comparison = st.session_state.get("area_comparison")
+    if comparison is not None:
+        compare_fig, compare_summary = comparison
+        if compare_summary.empty:
+            st.write("స్థల పరిమాణాలు ఇవ్వలేదు")
+        else:
+            metrics.figure_payload("comparison_heatmap", compare_fig)
+            st.plotly_chart(compare_fig, use_container_width=True)
+            st.dataframe(compare_summary, hide_index=True)
+
+# -----------------------------
+# Report History Panel
+# -----------------------------
+with st.expander("📜 గత ఫలితాలు (History)"):
+    report_store = load_report_store()
+    history_pages = -(-report_store.count() // SEARCH_PAGE_SIZE)
+    if history_pages:
+        history_page = st.number_input("Page", min_value=1, max_value=history_pages, value=1, step=1,
+                                       key="history_page")
+        st.dataframe(pd.DataFrame([
+            {
+                "గ్రామం": record["village_letter"],
+                "వ్యక్తి": record["person_letter"],
+                "Area (sq. ft)": record["area"],
+                "ధనం": record["money"],
+                "వ్యయం": record["expense"],
+                "Good Plot": record["good_area"],
+                "Good Vargas": sum(v == Verdict.GOOD for v in record["verdicts"].values()),
+                "Views": record["hits"],
+                "Last Seen": pd.to_datetime(record["last_seen"], unit="s"),
+            }
+            for record in report_store.history(history_page - 1, SEARCH_PAGE_SIZE)
+        ]), hide_index=True)
+    else:
+        st.write("ఇంకా ఫలితాలు లేవు")
+
+# -----------------------------
+# Debug Metrics Panel
+# -----------------------------
+if metrics.ENABLED:
+    snapshot = metrics.METRICS.snapshot()
+    with st.sidebar.expander("⏱️ Rerun metrics", expanded=False):
+        st.write(f"Reruns: {snapshot['reruns']}")
+        st.dataframe(pd.DataFrame(
+            [{"Section": name, "Runs": count, "Avg ms": 1000 * total / count, "Last ms": 1000 * last}
+             for name, (count, total, last) in snapshot["sections"].items()]
+        ), hide_index=True)
+        st.dataframe(pd.DataFrame(
+            [{"Cache": name, "Calls": calls, "Hit rate": (calls - misses) / calls if calls else 0.0}
+             for name, (calls, misses) in snapshot["cache_calls"].items()]
+        ), hide_index=True)
+        for name, (count, total, last) in snapshot["payloads"].items():
+            st.write(f"{name}: last {last} bytes, avg {total // count} bytes")
@@ -0,0 +1,176 @@
+"""
+Headless batch scoring for plot inventories.
+
+Streams a CSV or Parquet file of (village name, owner name, area) rows in
+chunks and writes the money/expense values, the 16 varga values, their
+verdicts and the good plot flag for every row:
+
+    python batch.py plots.csv scored.parquet --chunk-size 50000 --workers 4
+"""
+import argparse
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from chunked_io import ChunkWriter, pool_context, read_chunks
+from vastu import (
+    VARGA_KEYS, VERDICT_LABELS, MAX_AREA, first_letters, money_expense_pairs,
+    lookup_vastu_batch, is_good_area_batch, warn_meaning_issues
+)
+from vastu.store import ReportStore
+
+DEFAULT_CHUNK_SIZE = 50_000
+# Distinct names memoized before the name cache is emptied
+NAME_CACHE_SIZE = 100_000
+_VERDICT_LABELS = np.array(VERDICT_LABELS, dtype=object)
+
+
+# -----------------------------
+# Scoring
+# -----------------------------
+def _letters_of(names, cache):
+    return pd.Series(first_letters(names.to_numpy(dtype=object), cache), index=names.index)
+
+
+def valid_areas(raw_areas):
+    """
+    Returns (valid, areas): a mask of the entries that are whole numbers in
+    1..MAX_AREA, and the areas as int64 with 0 wherever they are not valid
+    """
+    areas = pd.to_numeric(raw_areas, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    with np.errstate(invalid="ignore"):
+        valid = np.isfinite(areas) & (areas == np.round(areas)) & (areas >= 1) & (areas <= MAX_AREA)
+    return valid, np.where(valid, areas, 0).astype(np.int64)
+
+
+def score_frame(df, village_col="village", person_col="person", area_col="area", caches=None):
+    """
+    Returns a DataFrame with the input columns followed by the scored columns.
+    The area columns are null for rows that valid_areas rejects.
+    caches is an optional dict reused across chunks to memoize per-name work.
+    The name cache is emptied once it holds NAME_CACHE_SIZE names, so memory
+    stays bounded however many distinct names the file has.
+    """
+    caches = caches if caches is not None else {}
+    letter_cache = caches.setdefault("letters", {})
+    if len(letter_cache) >= NAME_CACHE_SIZE:
+        letter_cache.clear()
+
+    out = df.reset_index(drop=True).copy()
+    village_letters = _letters_of(out[village_col], letter_cache)
+    person_letters = _letters_of(out[person_col], letter_cache)
+    out["village_letter"] = village_letters.astype("string")
+    out["person_letter"] = person_letters.astype("string")
+
+    money, expense, known = money_expense_pairs(village_letters.to_numpy(), person_letters.to_numpy())
+    out["money"] = pd.Series(money, dtype="Int8").where(known)
+    out["expense"] = pd.Series(expense, dtype="Int8").where(known)
+
+    valid, area_values = valid_areas(out[area_col])
+    values, verdicts, _ = lookup_vastu_batch(area_values)
+
+    for col, key in enumerate(VARGA_KEYS):
+        out[key] = pd.Series(values[:, col], dtype="UInt8").where(valid)
+    for col, key in enumerate(VARGA_KEYS):
+        out[f"{key}_verdict"] = pd.Series(_VERDICT_LABELS[verdicts[:, col]], dtype="string").where(valid)
+    out["good_area"] = pd.Series(is_good_area_batch(area_values), dtype="boolean").where(valid)
+    return out
+
+
+# -----------------------------
+# Parallel Execution
+# -----------------------------
+# Memo caches private to each worker process
+_WORKER_CACHES = {}
+
+
+def _score_chunk(chunk, village_col, person_col, area_col):
+    return score_frame(chunk, village_col, person_col, area_col, _WORKER_CACHES)
+
+
+def _score_chunks_parallel(chunks, columns, workers):
+    """
+    Yields scored chunks in input order. At most 2 * workers chunks are in
+    flight, so memory stays bounded however large the input is.
+    """
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=pool_context()) as pool:
+        for chunk in chunks:
+            pending.append(pool.submit(_score_chunk, chunk, *columns))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _store_chunk(store, scored, area_col):
+    # score_frame leaves good_area null exactly where valid_areas rejected the area
+    rows = scored[scored["village_letter"].notna() & scored["person_letter"].notna()
+                  & scored["good_area"].notna()]
+    store.bulk_insert(rows["village_letter"].to_numpy(dtype=object),
+                      rows["person_letter"].to_numpy(dtype=object),
+                      pd.to_numeric(rows[area_col]).to_numpy(dtype=np.int64))
+
+
+def score_file(input_path, output_path, village_col="village", person_col="person",
+               area_col="area", chunk_size=DEFAULT_CHUNK_SIZE, workers=1, store_path=None):
+    """
+    Scores input_path chunk by chunk into output_path. Returns the row count.
+    workers > 1 scores chunks in a process pool; workers = 0 uses every core.
+    Output order always matches input order. With store_path every scored
+    (village letter, person letter, area) is also saved to the report store.
+    """
+    columns = [village_col, person_col, area_col]
+    workers = workers or os.cpu_count() or 1
+    chunks = read_chunks(input_path, columns, chunk_size)
+    if workers == 1:
+        caches = {}
+        scored_chunks = (score_frame(chunk, *columns, caches) for chunk in chunks)
+    else:
+        scored_chunks = _score_chunks_parallel(chunks, columns, workers)
+
+    store = ReportStore(store_path) if store_path else None
+    rows = 0
+    with ChunkWriter(output_path) as writer:
+        for scored in scored_chunks:
+            writer.write(scored)
+            if store is not None:
+                _store_chunk(store, scored, area_col)
+            rows += len(scored)
+    if store is not None:
+        store.close()
+    return rows
+
+
+# -----------------------------
+# Command Line
+# -----------------------------
+def build_parser():
+    parser = argparse.ArgumentParser(description="Score a plot inventory file without the Streamlit UI.")
+    parser.add_argument("input", help="input .csv or .parquet file")
+    parser.add_argument("output", help="output .csv or .parquet file")
+    parser.add_argument("--village-col", default="village", help="column holding the village name")
+    parser.add_argument("--person-col", default="person", help="column holding the owner name")
+    parser.add_argument("--area-col", default="area", help="column holding the area in sq. ft")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="rows per chunk")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes for scoring chunks (0 = all cores)")
+    parser.add_argument("--store", metavar="PATH", help="also save scored reports to this SQLite store")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    warn_meaning_issues()
+    rows = score_file(args.input, args.output, args.village_col, args.person_col,
+                      args.area_col, args.chunk_size, args.workers, args.store)
+    print(f"Scored {rows} rows -> {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
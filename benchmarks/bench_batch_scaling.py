@@ -0,0 +1,64 @@
+"""
+Throughput of batch.score_file from 1 to N worker processes.
+
+    python benchmarks/bench_batch_scaling.py --rows 500000 --max-workers 8
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd  # noqa: E402
+
+from vastu import telugu_letters  # noqa: E402
+from batch import DEFAULT_CHUNK_SIZE, score_file  # noqa: E402
+
+
+def make_inventory(path, rows, seed=0):
+    rng = random.Random(seed)
+    letters = list(telugu_letters)
+    suffixes = ["పాడు", "పల్లి", "పురం", "గూడెం", "రావు", "మ్మ", "య్య", "లక్ష్మి"]
+    pd.DataFrame({
+        "village": [rng.choice(letters) + rng.choice(suffixes) for _ in range(rows)],
+        "person": [rng.choice(letters) + rng.choice(suffixes) for _ in range(rows)],
+        "area": [rng.randint(1, 100_000) for _ in range(rows)],
+    }).to_csv(path, index=False)
+
+
+def worker_counts(max_workers):
+    counts, n = [], 1
+    while n < max_workers:
+        counts.append(n)
+        n *= 2
+    return counts + [max_workers]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--output-format", choices=["csv", "parquet"], default="csv")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "inventory.csv")
+        make_inventory(source, args.rows)
+        print(f"{'workers':>8} {'seconds':>9} {'rows/sec':>12} {'speedup':>8}")
+        baseline = None
+        for workers in worker_counts(args.max_workers):
+            target = os.path.join(tmp, f"scored_{workers}.{args.output_format}")
+            start = time.perf_counter()
+            score_file(source, target, chunk_size=args.chunk_size, workers=workers)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(f"{workers:>8} {elapsed:>9.2f} {args.rows / elapsed:>12,.0f} {baseline / elapsed:>7.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
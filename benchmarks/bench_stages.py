@@ -0,0 +1,156 @@
+"""
+Per-stage benchmarks for the compute, table and rendering paths.
+
+    python benchmarks/bench_stages.py --save benchmarks/baseline.json
+    python benchmarks/bench_stages.py --baseline benchmarks/baseline.json --threshold 0.25
+
+Every stage is timed separately (median seconds per call) and its peak
+traced memory is measured with tracemalloc. With --baseline the run fails
+(exit status 1) when any stage is slower, or allocates more, than the
+baseline by more than --threshold. Nothing here needs a network or a
+running Streamlit server.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+from vastu import (  # noqa: E402
+    calculate_vastu, calculate_vastu_batch, calculate_money_expense, get_letter_group_info
+)
+from vastu.charts import create_radar_chart_plotly  # noqa: E402
+from vastu.engine import PERIOD  # noqa: E402
+from vastu.tables import _vastu_table_html, style_vastu, vastu_dataframe, vastu_items  # noqa: E402
+
+AREA = 1089
+BATCH_AREAS = np.arange(1, 100_001)
+
+
+def _figure_json():
+    import plotly.io as pio
+
+    return pio.to_json(create_radar_chart_plotly(calculate_vastu(AREA)))
+
+
+def _styled_html():
+    return vastu_dataframe(AREA).style.apply(style_vastu, axis=1).to_html()
+
+
+def _vastu_dataframe():
+    import pandas as pd
+
+    return pd.DataFrame(vastu_items(AREA))
+
+
+STAGES = {
+    "calculate_vastu": lambda: calculate_vastu(AREA),
+    "calculate_vastu_batch_100k": lambda: calculate_vastu_batch(BATCH_AREAS),
+    "calculate_money_expense": lambda: calculate_money_expense(18, 42),
+    "get_letter_group_info": lambda: get_letter_group_info("క"),
+    "vastu_items_dataframe": _vastu_dataframe,
+    "vastu_style_to_html": _styled_html,
+    "vastu_table_html_uncached": lambda: _vastu_table_html.__wrapped__(AREA % PERIOD),
+    "radar_figure": lambda: create_radar_chart_plotly(calculate_vastu(AREA)),
+    "radar_figure_json": _figure_json,
+}
+
+
+def time_stage(func, min_time=0.2, repeats=5):
+    """
+    Returns the median seconds per call over repeats rounds, each round
+    running enough calls to last at least min_time / repeats.
+    """
+    func()  # warm up lazy imports and caches
+    calls, elapsed = 1, 0.0
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / repeats:
+            break
+        calls *= 2
+    rounds = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        rounds.append((time.perf_counter() - start) / calls)
+    return statistics.median(rounds)
+
+
+def peak_memory(func):
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run(stages, min_time=0.2):
+    results = {}
+    for name in stages:
+        func = STAGES[name]
+        results[name] = {"seconds": time_stage(func, min_time), "peak_bytes": peak_memory(func)}
+    return results
+
+
+def compare(results, baseline, threshold):
+    """
+    Returns a list of regression messages for stages beyond threshold.
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        for metric in ("seconds", "peak_bytes"):
+            if previous[metric] and current[metric] > previous[metric] * (1 + threshold):
+                ratio = current[metric] / previous[metric]
+                regressions.append(f"{name}: {metric} {ratio:.2f}x baseline "
+                                   f"({current[metric]:.6g} vs {previous[metric]:.6g})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--stage", action="append", choices=sorted(STAGES),
+                        help="run only this stage (repeatable)")
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds spent timing each stage")
+    parser.add_argument("--save", metavar="PATH", help="write results as a JSON baseline")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown/growth before a stage counts as regressed")
+    args = parser.parse_args(argv)
+
+    results = run(args.stage or list(STAGES), args.min_time)
+    print(f"{'stage':<28} {'time/call':>12} {'peak memory':>12}")
+    for name, result in results.items():
+        print(f"{name:<28} {result['seconds'] * 1e6:>10.1f}us {result['peak_bytes'] / 1024:>10.1f}KB")
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(),
+                       "stages": results}, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["stages"]
+        regressions = compare(results, baseline, args.threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""
+Concurrent-session load harness for the Streamlit page (Main.py).
+
+    python benchmarks/load_app.py --processes 4 --sessions 4 --reruns 25 --save benchmarks/app_baseline.json
+    python benchmarks/load_app.py --processes 4 --sessions 4 --reruns 25 --baseline benchmarks/app_baseline.json
+
+Each worker process acts as one server. It hosts --sessions Streamlit
+AppTest sessions that share its st.cache_data, st.cache_resource and report
+store, and it takes them in turn. AppTest sessions cannot safely run on
+parallel threads in one process, so concurrency comes from the processes.
+Each session submits input_form with random letters and areas. Most
+submissions only change the area, as users do. The report gives per-rerun
+latency percentiles, reruns/sec and the growth in resident memory summed
+over the workers. With --baseline the run fails (exit status 1) when
+latency or memory growth rises, or throughput falls, by more than
+--threshold.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import random
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from vastu import telugu_letters  # noqa: E402
+
+APP_PATH = os.path.join(ROOT, "Main.py")
+# (metric, True when larger is worse)
+COMPARED = (("p50_ms", True), ("p99_ms", True), ("rss_growth_mb", True), ("reruns_per_sec", False))
+
+
+def rss_mb():
+    """
+    Returns the current resident set size in MB (peak RSS where /proc is missing)
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2 ** 20
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2 ** 20 if sys.platform == "darwin" else peak / 2 ** 10
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+def _submit(at, village, person, area):
+    at.selectbox[0].set_value(village)
+    at.selectbox[1].set_value(person)
+    at.number_input[0].set_value(area)
+    at.button[0].click()
+    start = time.perf_counter()
+    at.run()
+    return time.perf_counter() - start
+
+
+def _worker(sessions, reruns, seed, max_area, timeout):
+    """
+    Runs one worker's sessions in turn. Returns (latencies, errors,
+    measured start and end wall-clock times, RSS after the first render
+    and at the end in MB).
+    """
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(seed)
+    letters = list(telugu_letters)
+    apps = [AppTest.from_file(APP_PATH, default_timeout=timeout) for _ in range(sessions)]
+    inputs = [[rng.choice(letters), rng.choice(letters)] for _ in range(sessions)]
+    for at in apps:
+        at.run()
+
+    # Memory growth is measured from the warmed-up first render
+    rss_start = rss_mb()
+    latencies, errors = [], []
+    started = time.time()
+    for _ in range(reruns):
+        for at, letters_in_use in zip(apps, inputs):
+            roll = rng.random()
+            if roll >= 0.7:
+                letters_in_use[1] = rng.choice(letters)
+            if roll >= 0.9:
+                letters_in_use[0] = rng.choice(letters)
+            latencies.append(_submit(at, *letters_in_use, rng.randint(1, max_area)))
+            errors += [str(exc.value) for exc in at.exception]
+    return latencies, errors, started, time.time(), rss_start, rss_mb()
+
+
+def run_load(processes, sessions, reruns, seed=0, max_area=10_000, timeout=60):
+    """
+    Returns a report dict with rerun count, errors, reruns/sec, latency
+    percentiles in milliseconds and summed worker RSS before and after in MB.
+    """
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=processes, mp_context=context) as pool:
+        results = list(pool.map(_worker, [sessions] * processes, [reruns] * processes,
+                                range(seed, seed + processes), [max_area] * processes,
+                                [timeout] * processes))
+    latencies = [latency for result in results for latency in result[0]]
+    errors = [error for result in results for error in result[1]]
+    elapsed = max(r[3] for r in results) - min(r[2] for r in results)
+    rss_start = sum(r[4] for r in results)
+    rss_end = sum(r[5] for r in results)
+    return {
+        "processes": processes,
+        "sessions": processes * sessions,
+        "reruns": len(latencies),
+        "errors": len(errors),
+        "seconds": round(elapsed, 3),
+        "reruns_per_sec": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p90_ms": round(percentile(latencies, 90) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "max_ms": round(max(latencies) * 1000, 3),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "rss_start_mb": round(rss_start, 1),
+        "rss_end_mb": round(rss_end, 1),
+        "rss_growth_mb": round(rss_end - rss_start, 1),
+    }
+
+
+def compare(report, baseline, threshold):
+    """
+    Returns a list of regression messages for metrics beyond threshold.
+    """
+    regressions = []
+    for metric, larger_is_worse in COMPARED:
+        previous, current = baseline.get(metric), report[metric]
+        if not previous:
+            continue
+        ratio = current / previous
+        if (ratio > 1 + threshold) if larger_is_worse else (ratio < 1 - threshold):
+            regressions.append(f"{metric}: {ratio:.2f}x baseline ({current:.6g} vs {previous:.6g})")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1, help="worker processes")
+    parser.add_argument("--sessions", type=int, default=4, help="sessions per worker process")
+    parser.add_argument("--reruns", type=int, default=20, help="form submissions per session")
+    parser.add_argument("--max-area", type=int, default=10_000, help="largest random area")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--timeout", type=float, default=60, help="seconds allowed per rerun")
+    parser.add_argument("--save", metavar="PATH", help="write the report as a JSON baseline")
+    parser.add_argument("--baseline", metavar="PATH", help="compare against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed change before a metric counts as regressed")
+    args = parser.parse_args(argv)
+
+    # Keep the harness's reports out of the real store
+    os.environ.setdefault("VASTU_STORE_PATH", os.path.join(tempfile.mkdtemp(), "load_app.sqlite3"))
+    report = run_load(args.processes, args.sessions, args.reruns, args.seed, args.max_area, args.timeout)
+    print(json.dumps(report, indent=2))
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(),
+                       "report": report}, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["report"]
+        regressions = compare(report, baseline, args.threshold)
+        for message in regressions:
+            print(f"REGRESSION {message}", file=sys.stderr)
+        return 1 if regressions or report["errors"] else 0
+    return 1 if report["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
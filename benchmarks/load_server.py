@@ -0,0 +1,101 @@
+"""
+Load generator for server.py: keep-alive clients posting random requests.
+
+    python server.py --port 8502 &
+    python benchmarks/load_server.py --port 8502 --concurrency 64 --requests 20000
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from vastu import telugu_letters  # noqa: E402
+
+
+def _request_bytes(host, payload):
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    head = (f"POST /score HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n")
+    return head.encode("latin-1") + body
+
+
+async def _read_response(reader):
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def _client(host, port, count, latencies, statuses, rng):
+    letters = list(telugu_letters)
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(count):
+            payload = {"village": rng.choice(letters), "person": rng.choice(letters),
+                       "area": rng.randint(1, 10_000)}
+            start = time.perf_counter()
+            writer.write(_request_bytes(host, payload))
+            await writer.drain()
+            status = await _read_response(reader)
+            latencies.append(time.perf_counter() - start)
+            statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        writer.close()
+
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+
+async def run_load(host, port, concurrency, requests, seed=0):
+    """
+    Returns a report dict with request count, status counts, requests/sec
+    and p50/p99 latency in milliseconds.
+    """
+    latencies, statuses = [], {}
+    per_client = [requests // concurrency + (i < requests % concurrency) for i in range(concurrency)]
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(host, port, n, latencies, statuses, random.Random(seed + i))
+        for i, n in enumerate(per_client) if n
+    ))
+    elapsed = time.perf_counter() - start
+    return {
+        "requests": len(latencies),
+        "statuses": statuses,
+        "seconds": round(elapsed, 3),
+        "requests_per_sec": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8502)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=10_000)
+    args = parser.parse_args(argv)
+    report = asyncio.run(run_load(args.host, args.port, args.concurrency, args.requests))
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+"""
+Chunked file IO and process pools shared by the batch and report CLIs.
+
+CSV and Parquet inputs are read, and outputs written, a chunk at a time so
+memory stays bounded however large the file is. Parquet needs pyarrow.
+"""
+import multiprocessing
+import os
+import sys
+
+import pandas as pd
+
+
+# -----------------------------
+# Chunked Readers & Writers
+# -----------------------------
+def _file_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".parquet", ".pq"):
+        return "parquet"
+    if ext in (".csv", ".txt"):
+        return "csv"
+    raise ValueError(f"Unsupported file type '{ext}'. Use .csv or .parquet")
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        raise ImportError("Parquet input/output requires pyarrow: pip install pyarrow") from None
+
+
+def read_chunks(path, columns, chunk_size):
+    """
+    Yields DataFrames of at most chunk_size rows holding columns of a CSV or
+    Parquet file. CSV columns are read as strings.
+    """
+    if _file_format(path) == "parquet":
+        _require_pyarrow()
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size, columns=columns):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunk_size, dtype=str)
+
+
+class ChunkWriter:
+    """
+    Appends scored chunks to a CSV or Parquet file without holding earlier chunks.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.format = _file_format(path)
+        self._writer = None
+        self._schema = None
+        self._header_written = False
+        if self.format == "parquet":
+            _require_pyarrow()
+
+    def write(self, df):
+        if self.format == "csv":
+            df.to_csv(self.path, mode="a" if self._header_written else "w",
+                      header=not self._header_written, index=False)
+            self._header_written = True
+            return
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        table = pa.Table.from_pandas(df, schema=self._schema, preserve_index=False)
+        if self._writer is None:
+            self._schema = table.schema
+            self._writer = pq.ParquetWriter(self.path, self._schema)
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# -----------------------------
+# Process Pools
+# -----------------------------
+def pool_context():
+    """
+    Returns the multiprocessing context for worker pools: fork on Linux,
+    the platform default elsewhere
+    """
+    # Forked workers inherit the lookup tables built at import instead of
+    # rebuilding them, and share those pages with the parent read-only.
+    # fork is only safe to rely on under Linux; macOS defaults to spawn
+    # because forking there can crash in system frameworks.
+    if sys.platform.startswith("linux"):
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
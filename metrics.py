@@ -0,0 +1,184 @@
+"""
+Opt-in rerun instrumentation for the Streamlit page.
+
+Set VASTU_METRICS=1 to record per-section timings, rerun counts, cache hit
+rates and figure payload sizes. They are served as Prometheus text on
+http://127.0.0.1:$VASTU_METRICS_PORT/metrics (default 9108) and shown in a
+debug sidebar panel. When the variable is unset every hook is a no-op.
+"""
+import json
+import os
+import threading
+import time
+import warnings
+from contextlib import nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ENABLED = os.environ.get("VASTU_METRICS", "").lower() not in ("", "0", "false", "no")
+METRICS_HOST = os.environ.get("VASTU_METRICS_HOST", "127.0.0.1")
+METRICS_PORT = int(os.environ.get("VASTU_METRICS_PORT", "9108"))
+
+
+class Metrics:
+    """
+    Process-wide counters shared by every session. All methods are thread safe.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reruns = 0
+        self.sections = {}      # section -> [count, total seconds, last seconds]
+        self.cache_calls = {}   # cache -> [calls, misses]
+        self.payloads = {}      # name -> [count, total bytes, last bytes]
+
+    def count_rerun(self):
+        with self._lock:
+            self.reruns += 1
+
+    def observe_section(self, section, seconds):
+        with self._lock:
+            entry = self.sections.setdefault(section, [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = seconds
+
+    def count_cache_call(self, cache):
+        with self._lock:
+            self.cache_calls.setdefault(cache, [0, 0])[0] += 1
+
+    def count_cache_miss(self, cache):
+        with self._lock:
+            self.cache_calls.setdefault(cache, [0, 0])[1] += 1
+
+    def observe_payload(self, name, size):
+        with self._lock:
+            entry = self.payloads.setdefault(name, [0, 0, 0])
+            entry[0] += 1
+            entry[1] += size
+            entry[2] = size
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                "reruns": self.reruns,
+                "sections": {k: list(v) for k, v in self.sections.items()},
+                "cache_calls": {k: list(v) for k, v in self.cache_calls.items()},
+                "payloads": {k: list(v) for k, v in self.payloads.items()},
+            }
+
+    def render_prometheus(self):
+        snap = self.snapshot()
+        lines = [
+            "# HELP vastu_reruns_total Script reruns across all sessions.",
+            "# TYPE vastu_reruns_total counter",
+            f"vastu_reruns_total {snap['reruns']}",
+            "# HELP vastu_section_seconds Wall time spent in each page section.",
+            "# TYPE vastu_section_seconds summary",
+        ]
+        for section, (count, total, _) in sorted(snap["sections"].items()):
+            lines.append(f'vastu_section_seconds_sum{{section="{section}"}} {total:.6f}')
+            lines.append(f'vastu_section_seconds_count{{section="{section}"}} {count}')
+        lines += [
+            "# HELP vastu_cache_requests_total Cached function calls by result.",
+            "# TYPE vastu_cache_requests_total counter",
+        ]
+        for cache, (calls, misses) in sorted(snap["cache_calls"].items()):
+            lines.append(f'vastu_cache_requests_total{{cache="{cache}",result="hit"}} {calls - misses}')
+            lines.append(f'vastu_cache_requests_total{{cache="{cache}",result="miss"}} {misses}')
+        lines += [
+            "# HELP vastu_payload_bytes Serialized size of payloads sent to the browser.",
+            "# TYPE vastu_payload_bytes summary",
+        ]
+        for name, (count, total, _) in sorted(snap["payloads"].items()):
+            lines.append(f'vastu_payload_bytes_sum{{payload="{name}"}} {total}')
+            lines.append(f'vastu_payload_bytes_count{{payload="{name}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+METRICS = Metrics()
+
+
+# -----------------------------
+# Hooks used by Main.py
+# -----------------------------
+class _SectionTimer:
+    __slots__ = ("section", "start")
+
+    def __init__(self, section):
+        self.section = section
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        METRICS.observe_section(self.section, time.perf_counter() - self.start)
+
+
+_NULL_TIMER = nullcontext()
+
+
+def timed(section):
+    return _SectionTimer(section) if ENABLED else _NULL_TIMER
+
+
+def count_rerun():
+    if ENABLED:
+        METRICS.count_rerun()
+
+
+def cache_call(cache):
+    if ENABLED:
+        METRICS.count_cache_call(cache)
+
+
+def cache_miss(cache):
+    if ENABLED:
+        METRICS.count_cache_miss(cache)
+
+
+def figure_payload(name, figure):
+    if ENABLED:
+        payload = figure if isinstance(figure, dict) else figure.to_dict()
+        METRICS.observe_payload(name, len(json.dumps(payload, default=str)))
+
+
+# -----------------------------
+# Prometheus endpoint
+# -----------------------------
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path != "/metrics":
+            self.send_error(404)
+            return
+        body = METRICS.render_prometheus().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(host=METRICS_HOST, port=METRICS_PORT):
+    """
+    Starts the /metrics endpoint on a daemon thread, once per process.
+    Returns the server, or None when metrics are disabled.
+    """
+    global _server
+    if not ENABLED:
+        return None
+    with _server_lock:
+        if _server is None:
+            try:
+                _server = ThreadingHTTPServer((host, port), _MetricsHandler)
+            except OSError as exc:
+                warnings.warn(f"Metrics endpoint not started on {host}:{port}: {exc}")
+                return None
+            threading.Thread(target=_server.serve_forever, name="vastu-metrics", daemon=True).start()
+    return _server
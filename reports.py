@@ -0,0 +1,347 @@
+"""
+Bulk printable reports for plot inventories.
+
+Reads a CSV or Parquet file of (village name, owner name, area) rows in
+chunks and writes one PDF or PNG per row with the rashi & nakshatram table,
+the money/expense table, the 16 varga results and a radar chart:
+
+    python reports.py plots.csv reports/ --format pdf --workers 0
+
+Rendering uses matplotlib's Agg canvas without pyplot, so no display is
+needed. Chunks are rendered in a process pool and every worker writes its
+files straight to disk. Radar artwork depends only on area % PERIOD, so
+each worker draws it once per result vector and reuses it. Telugu text
+needs a font with Telugu glyphs (found automatically, or pass --font).
+"""
+import argparse
+import os
+import re
+import sys
+import textwrap
+import time
+import warnings
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+import numpy as np
+
+from chunked_io import pool_context, read_chunks
+from vastu import (
+    VARGA_KEYS, PERIOD, Verdict, first_letters, money_expense_pairs,
+    lookup_vastu, is_good_area, get_letter_group_info, warn_meaning_issues
+)
+from vastu.charts import VERDICT_COLORS
+from vastu.data import div
+from vastu.tables import vastu_items
+
+DEFAULT_CHUNK_SIZE = 200
+FORMATS = ("pdf", "png")
+ROW_COLORS = {"మంచిది": "#c6f5d3", "మంచిదికాదు": "#f5c6c6"}
+PLAIN_ROW_COLOR = "#f0f0f0"
+HEADER_COLOR = "#182952"
+_TELUGU_FONTS = ("Noto Sans Telugu", "Noto Serif Telugu", "Lohit Telugu", "Gautami", "Pothana2000", "Vani")
+
+
+# -----------------------------
+# Fonts
+# -----------------------------
+def configure_fonts(font_path=None):
+    """
+    Puts a Telugu capable font first in matplotlib's font list, either the
+    file at font_path or the first installed one from _TELUGU_FONTS.
+    Returns the font name, or None when no Telugu font is available.
+    """
+    import matplotlib
+    from matplotlib import font_manager
+
+    name = None
+    if font_path:
+        font_manager.fontManager.addfont(font_path)
+        name = font_manager.FontProperties(fname=font_path).get_name()
+    else:
+        installed = {font.name for font in font_manager.fontManager.ttflist}
+        name = next((font for font in _TELUGU_FONTS if font in installed), None)
+    if name:
+        matplotlib.rcParams["font.family"] = [name, "DejaVu Sans"]
+    return name
+
+
+# -----------------------------
+# Rendering
+# -----------------------------
+@lru_cache(maxsize=1024)
+def radar_image(residue):
+    """
+    Returns the radar chart for one result vector as an RGBA array
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    values, verdicts, _ = lookup_vastu(residue)
+    angles = np.linspace(0, 2 * np.pi, len(VARGA_KEYS), endpoint=False)
+    closed = np.append(angles, angles[0])
+
+    fig = Figure(figsize=(4, 4), dpi=150)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot(projection="polar")
+    ax.plot(closed, np.append(values, values[0]), color="blue", linewidth=1.5)
+    ax.fill(closed, np.append(values, values[0]), color="blue", alpha=0.1)
+    ax.scatter(angles, values, c=[VERDICT_COLORS[Verdict(v)] for v in verdicts], s=30, zorder=3)
+    ax.set_xticks(angles)
+    ax.set_xticklabels([key.capitalize() for key in VARGA_KEYS], fontsize=7)
+    ax.set_ylim(0, max(div.values()))
+    ax.tick_params(axis="y", labelsize=6)
+    fig.tight_layout()
+    canvas.draw()
+    return np.asarray(canvas.buffer_rgba()).copy()
+
+
+@contextmanager
+def _missing_glyphs_ignored():
+    # Without a Telugu font every missing glyph warns; the text is still laid out
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="Glyph .* missing from font")
+        yield
+
+
+def _wrap_cell(text, renderer, font_size, width):
+    """
+    Wraps text at spaces into lines that fit width pixels when drawn at
+    font_size. Words are never split, so an akshara stays whole; a single
+    word wider than width gets a line to itself.
+    """
+    from matplotlib.font_manager import FontProperties
+
+    font = FontProperties(size=font_size)
+
+    def text_width(line):
+        with _missing_glyphs_ignored():
+            return renderer.get_text_width_height_descent(line, font, ismath=False)[0]
+
+    def fits(line):
+        return " " not in line or text_width(line) <= width
+
+    text = str(text)
+    if fits(text):
+        return text
+    # Start from the average character width and narrow until every line fits
+    chars = max(int(len(text) * width / text_width(text)), 1)
+    lines = textwrap.wrap(text, chars, break_long_words=False)
+    while chars > 1 and not all(fits(line) for line in lines):
+        chars -= 1
+        lines = textwrap.wrap(text, chars, break_long_words=False)
+    return "\n".join(lines)
+
+
+def _draw_table(ax, title, columns, rows, row_colors=None, col_widths=None, font_size=8, wrap_col=None):
+    """
+    Draws rows as a table filling ax from the top. Text in column wrap_col
+    is wrapped to the column width, and every row is as tall as its longest
+    cell.
+    """
+    ax.axis("off")
+    ax.set_title(title, loc="left", fontsize=10, fontweight="bold")
+    if not rows:
+        ax.text(0, 0.5, "-", fontsize=font_size)
+        return
+    if wrap_col is not None:
+        from matplotlib.table import Cell
+
+        # The cell text is inset by PAD of the cell width on either side
+        width = ax.bbox.width * (col_widths[wrap_col] if col_widths else 1 / len(columns)) * (1 - 2 * Cell.PAD)
+        renderer = ax.figure.canvas.get_renderer()
+        rows = [[_wrap_cell(value, renderer, font_size, width) if col == wrap_col else value
+                 for col, value in enumerate(row)] for row in rows]
+    table = ax.table(cellText=rows, colLabels=columns, colWidths=col_widths, loc="upper center", cellLoc="left")
+    table.auto_set_font_size(False)
+    table.set_fontsize(font_size)
+    line_counts = [1] + [max(str(value).count("\n") + 1 for value in row) for row in rows]
+    for (row, _), cell in table.get_celld().items():
+        cell.set_height(cell.get_height() * line_counts[row])
+        if row == 0:
+            cell.set_facecolor(HEADER_COLOR)
+            cell.get_text().set_color("white")
+        elif row_colors is not None:
+            cell.set_facecolor(row_colors[row - 1])
+
+
+def render_report(path, village, person, village_letter, person_letter, area, money, expense):
+    """
+    Renders one report page to path; the format follows the extension
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(8.27, 11.69), dpi=100)
+    # Measures text for wrapping; savefig still picks the writer from the extension
+    FigureCanvasAgg(fig)
+    fig.text(0.05, 0.965, "తెలుగు వాస్తు - షోడశ వర్గాలు", fontsize=16, fontweight="bold", color=HEADER_COLOR)
+    fig.text(0.05, 0.94, f"{village} ({village_letter})  ·  {person} ({person_letter})  ·  {area} sq. ft",
+             fontsize=10)
+    plot_kind = "Good Plot" if is_good_area(area) else "Normal Plot"
+    fig.text(0.05, 0.92, plot_kind, fontsize=10,
+             color=VERDICT_COLORS[Verdict.GOOD] if plot_kind == "Good Plot" else "black")
+
+    groups = get_letter_group_info(person_letter)
+    _draw_table(fig.add_axes([0.05, 0.78, 0.55, 0.12]), "రాశి & నక్షత్రము",
+                ["Letters", "Rashi", "Nakshatram"],
+                [[g["Letters"], g["Rashi"], g["Nakshatram"]] for g in groups])
+    _draw_table(fig.add_axes([0.65, 0.78, 0.3, 0.12]), "ధనం / వ్యయం",
+                ["Item", "Value"], [["ధనం", money], ["వ్యయం", expense]])
+
+    items = vastu_items(area)
+    _draw_table(fig.add_axes([0.05, 0.05, 0.9, 0.43]), "షోడశ వర్గ ఫలితాలు",
+                ["Vastu Item", "Value", "Meaning", "Verdict"],
+                [[i["Vastu Item"], i["Value"], i["Meaning"], i["Verdict"]] for i in items],
+                row_colors=[ROW_COLORS.get(i["Verdict"], PLAIN_ROW_COLOR) for i in items],
+                col_widths=[0.15, 0.08, 0.5, 0.27], wrap_col=2)
+
+    radar_ax = fig.add_axes([0.25, 0.5, 0.5, 0.27])
+    radar_ax.imshow(radar_image(area % PERIOD))
+    radar_ax.axis("off")
+
+    with _missing_glyphs_ignored():
+        fig.savefig(path)
+
+
+def _parse_area(raw_area):
+    try:
+        area = float(raw_area)
+    except (TypeError, ValueError):
+        return None
+    return int(area) if area.is_integer() and area >= 1 else None
+
+
+def _file_name(row_number, area, report_id, fmt):
+    stem = f"{row_number:06d}_{area}" if report_id is None else re.sub(r"[^\w.-]", "_", str(report_id))
+    return f"{stem}.{fmt}"
+
+
+def render_chunk(rows, output_dir, fmt):
+    """
+    Renders (row number, id, village, person, area) rows and returns
+    (written, skipped). Rows with an unknown letter or a bad area are skipped.
+    """
+    rows = list(rows)
+    if not rows:
+        return 0, 0
+    numbers, ids, villages, persons, areas = zip(*rows)
+    letter_cache = {}
+    village_letters = first_letters(np.asarray(villages, dtype=object), letter_cache)
+    person_letters = first_letters(np.asarray(persons, dtype=object), letter_cache)
+    money, expense, known = money_expense_pairs(village_letters, person_letters)
+
+    written = skipped = 0
+    for i, raw_area in enumerate(areas):
+        area = _parse_area(raw_area)
+        if not known[i] or area is None:
+            skipped += 1
+            continue
+        path = os.path.join(output_dir, _file_name(numbers[i], area, ids[i], fmt))
+        render_report(path, villages[i], persons[i], village_letters[i], person_letters[i],
+                      area, int(money[i]), int(expense[i]))
+        written += 1
+    return written, skipped
+
+
+def _chunk_rows(chunks, columns, id_col):
+    """
+    Turns DataFrame chunks into lists of (row number, id, village, person, area)
+    """
+    row_number = 0
+    for chunk in chunks:
+        ids = chunk[id_col].tolist() if id_col else [None] * len(chunk)
+        numbers = range(row_number, row_number + len(chunk))
+        row_number += len(chunk)
+        yield list(zip(numbers, ids, *(chunk[col].tolist() for col in columns)))
+
+
+def _render_chunks_parallel(row_chunks, output_dir, fmt, workers, font_path):
+    """
+    Yields (written, skipped) per chunk as workers finish them. At most
+    2 * workers chunks are in flight, so memory stays bounded.
+    """
+    pending = deque()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=pool_context(),
+                             initializer=configure_fonts, initargs=(font_path,)) as pool:
+        for rows in row_chunks:
+            pending.append(pool.submit(render_chunk, rows, output_dir, fmt))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def generate_reports(input_path, output_dir, village_col="village", person_col="person", area_col="area",
+                     id_col=None, fmt="pdf", chunk_size=DEFAULT_CHUNK_SIZE, workers=1, font_path=None,
+                     progress=None):
+    """
+    Writes one report per input row into output_dir and returns
+    (written, skipped). workers = 0 uses every core. progress, when given,
+    is called with the running (written, skipped) totals after each chunk.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unsupported report format '{fmt}'. Use one of {', '.join(FORMATS)}")
+    os.makedirs(output_dir, exist_ok=True)
+    columns = [village_col, person_col, area_col]
+    workers = workers or os.cpu_count() or 1
+    chunks = read_chunks(input_path, columns + ([id_col] if id_col else []), chunk_size)
+    row_chunks = _chunk_rows(chunks, columns, id_col)
+
+    if workers == 1:
+        configure_fonts(font_path)
+        results = (render_chunk(rows, output_dir, fmt) for rows in row_chunks)
+    else:
+        results = _render_chunks_parallel(row_chunks, output_dir, fmt, workers, font_path)
+
+    written = skipped = 0
+    for chunk_written, chunk_skipped in results:
+        written += chunk_written
+        skipped += chunk_skipped
+        if progress is not None:
+            progress(written, skipped)
+    return written, skipped
+
+
+# -----------------------------
+# Command Line
+# -----------------------------
+def build_parser():
+    parser = argparse.ArgumentParser(description="Render printable vastu reports for a plot inventory.")
+    parser.add_argument("input", help="input .csv or .parquet file")
+    parser.add_argument("output_dir", help="directory the reports are written to")
+    parser.add_argument("--format", choices=FORMATS, default="pdf", help="report file format")
+    parser.add_argument("--village-col", default="village", help="column holding the village name")
+    parser.add_argument("--person-col", default="person", help="column holding the owner name")
+    parser.add_argument("--area-col", default="area", help="column holding the area in sq. ft")
+    parser.add_argument("--id-col", help="column used for report file names (default: row number and area)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="rows per work unit")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes for rendering (0 = all cores)")
+    parser.add_argument("--font", metavar="PATH", help="font file with Telugu glyphs")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    warn_meaning_issues()
+    if configure_fonts(args.font) is None:
+        print("No Telugu font found; Telugu text will be missing. Use --font PATH.", file=sys.stderr)
+    start = time.perf_counter()
+
+    def report_progress(written, skipped):
+        rate = written / max(time.perf_counter() - start, 1e-9)
+        print(f"\r{written} written, {skipped} skipped ({rate:.1f}/s)", end="", file=sys.stderr, flush=True)
+
+    written, skipped = generate_reports(
+        args.input, args.output_dir, args.village_col, args.person_col, args.area_col, args.id_col,
+        args.format, args.chunk_size, args.workers, args.font, report_progress
+    )
+    print(f"\nWrote {written} reports ({skipped} skipped) -> {args.output_dir}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,285 @@
+"""
+Asynchronous JSON scoring service built on the vastu compute core.
+
+    python server.py --port 8502
+
+POST /score with {"village": "...", "person": "...", "area": 1200} (names or
+first letters) returns the money/expense values, the 16 varga values and
+verdicts, the good plot flag and the person letter's Rashi groups. Requests
+that arrive within --batch-window-ms of each other are scored together in
+one vectorized evaluation. Connections are kept alive between requests and
+a full request queue answers 503 instead of queueing without bound.
+"""
+import argparse
+import asyncio
+import json
+import sys
+
+from vastu import (
+    VARGA_KEYS, VERDICT_LABELS, MAX_AREA, first_letters, money_expense_pairs,
+    lookup_vastu_batch, is_good_area_batch, get_letter_group_info, warn_meaning_issues
+)
+
+DEFAULT_PORT = 8502
+DEFAULT_BATCH_WINDOW_MS = 2.0
+DEFAULT_MAX_BATCH = 512
+DEFAULT_QUEUE_SIZE = 4096
+KEEP_ALIVE_TIMEOUT = 15.0
+MAX_BODY_BYTES = 64 * 1024
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+class BadRequest(ValueError):
+    status = 400
+
+
+class PayloadTooLarge(BadRequest):
+    status = 413
+
+
+# -----------------------------
+# Scoring
+# -----------------------------
+def parse_score_request(payload):
+    """
+    Returns (village, person, area) from a request body, raising BadRequest.
+    """
+    if not isinstance(payload, dict):
+        raise BadRequest("Expected a JSON object")
+    village = payload.get("village", payload.get("village_letter"))
+    person = payload.get("person", payload.get("person_letter"))
+    area = payload.get("area")
+    if not isinstance(village, str) or not isinstance(person, str):
+        raise BadRequest("'village' and 'person' must be strings")
+    if isinstance(area, bool) or not isinstance(area, int) or not 1 <= area <= MAX_AREA:
+        raise BadRequest(f"'area' must be an integer from 1 to {MAX_AREA}")
+    return village, person, area
+
+
+def score_batch(requests):
+    """
+    Scores a list of (village, person, area) tuples in one vectorized pass.
+    """
+    villages, persons, areas = zip(*requests)
+    village_letters = first_letters(villages)
+    person_letters = first_letters(persons)
+    money, expense, known = money_expense_pairs(village_letters, person_letters)
+    values, verdicts, _ = lookup_vastu_batch(areas)
+    good = is_good_area_batch(areas)
+
+    results = []
+    for i in range(len(requests)):
+        results.append({
+            "village_letter": village_letters[i],
+            "person_letter": person_letters[i],
+            "money": int(money[i]) if known[i] else None,
+            "expense": int(expense[i]) if known[i] else None,
+            "vastu": dict(zip(VARGA_KEYS, values[i].tolist())),
+            "verdicts": {key: VERDICT_LABELS[v] for key, v in zip(VARGA_KEYS, verdicts[i])},
+            "good_area": bool(good[i]),
+            "letter_groups": get_letter_group_info(person_letters[i]),
+        })
+    return results
+
+
+class MicroBatcher:
+    """
+    Collects requests from concurrent connections into batches of up to
+    max_batch, waiting at most window seconds after the first one arrives.
+    """
+
+    def __init__(self, window=DEFAULT_BATCH_WINDOW_MS / 1000, max_batch=DEFAULT_MAX_BATCH,
+                 queue_size=DEFAULT_QUEUE_SIZE):
+        self.window = window
+        self.max_batch = max_batch
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self._task = None
+
+    def start(self):
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    def submit(self, request):
+        """
+        Returns a future for the request's result. Raises asyncio.QueueFull
+        when the queue is at capacity so the caller can shed load.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((request, future))
+        return future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            self._resolve(batch)
+
+    @staticmethod
+    def _resolve(batch):
+        try:
+            results = score_batch([request for request, _ in batch])
+        except Exception:
+            # Score one at a time so a bad request fails only its own future
+            for request, future in batch:
+                if future.done():
+                    continue
+                try:
+                    future.set_result(score_batch([request])[0])
+                except Exception as exc:
+                    future.set_exception(exc)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+# -----------------------------
+# HTTP/1.1
+# -----------------------------
+async def _read_request(reader):
+    """
+    Returns (method, path, headers, body), or None when the client closed.
+    """
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    try:
+        method, path, _ = request_line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise BadRequest("Malformed request line") from None
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get("content-length", 0) or 0)
+    except ValueError:
+        raise BadRequest("Invalid Content-Length") from None
+    if length > MAX_BODY_BYTES:
+        raise PayloadTooLarge(f"Body exceeds {MAX_BODY_BYTES} bytes")
+    body = await reader.readexactly(length) if length else b""
+    return method, path, headers, body
+
+
+def _response(status, payload, keep_alive, extra_headers=()):
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    lines = [
+        f"HTTP/1.1 {status} {_REASONS[status]}",
+        "Content-Type: application/json; charset=utf-8",
+        f"Content-Length: {len(body)}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+        *extra_headers,
+    ]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+class ScoringServer:
+    def __init__(self, batcher):
+        self.batcher = batcher
+
+    async def handle_connection(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request = await asyncio.wait_for(_read_request(reader), KEEP_ALIVE_TIMEOUT)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except BadRequest as exc:
+                    writer.write(_response(exc.status, {"error": str(exc)}, keep_alive=False))
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                writer.write(await self.dispatch(method, path, body, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    async def dispatch(self, method, path, body, keep_alive):
+        try:
+            return await self._dispatch(method, path, body, keep_alive)
+        except Exception as exc:
+            return _response(500, {"error": f"Internal error: {exc}"}, keep_alive)
+
+    async def _dispatch(self, method, path, body, keep_alive):
+        if path == "/health":
+            return _response(200, {"status": "ok", "queued": self.batcher.queue.qsize()}, keep_alive)
+        if path != "/score":
+            return _response(404, {"error": f"Unknown path {path}"}, keep_alive)
+        if method != "POST":
+            return _response(405, {"error": "Use POST"}, keep_alive)
+        try:
+            request = parse_score_request(json.loads(body or b"null"))
+        except (BadRequest, ValueError) as exc:
+            return _response(400, {"error": str(exc)}, keep_alive)
+        try:
+            future = self.batcher.submit(request)
+        except asyncio.QueueFull:
+            return _response(503, {"error": "Server busy"}, keep_alive, ("Retry-After: 1",))
+        return _response(200, await future, keep_alive)
+
+
+async def serve(host="127.0.0.1", port=DEFAULT_PORT, window=DEFAULT_BATCH_WINDOW_MS / 1000,
+                max_batch=DEFAULT_MAX_BATCH, queue_size=DEFAULT_QUEUE_SIZE, ready=None):
+    batcher = MicroBatcher(window, max_batch, queue_size)
+    batcher.start()
+    server = await asyncio.start_server(ScoringServer(batcher).handle_connection, host, port)
+    if ready is not None:
+        ready.set_result(server.sockets[0].getsockname()[1])
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await batcher.stop()
+
+
+# -----------------------------
+# Command Line
+# -----------------------------
+def build_parser():
+    parser = argparse.ArgumentParser(description="Serve vastu scoring as JSON over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--batch-window-ms", type=float, default=DEFAULT_BATCH_WINDOW_MS,
+                        help="how long to wait for more requests to join a batch")
+    parser.add_argument("--max-batch", type=int, default=DEFAULT_MAX_BATCH)
+    parser.add_argument("--queue-size", type=int, default=DEFAULT_QUEUE_SIZE,
+                        help="pending requests beyond this are rejected with 503")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    warn_meaning_issues()
+    print(f"Serving on http://{args.host}:{args.port}/score", file=sys.stderr)
+    try:
+        asyncio.run(serve(args.host, args.port, args.batch_window_ms / 1000,
+                          args.max_batch, args.queue_size))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
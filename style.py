@@ -84,6 +84,21 @@ def load_custom_styles():
             background-color: var(--red-bad) !important;
         }
 
+        .plain-row td {
+            background-color: #f0f0f0 !important;
+        }
+
+        .vastu-table {
+            width: 100%;
+            border-collapse: collapse;
+            margin-bottom: 16px;
+        }
+
+        .vastu-table td {
+            padding: 6px 8px;
+            border: 1px solid var(--border-light);
+        }
+
         /* -----------------------------------------------------------
            BUTTON STYLING
         ------------------------------------------------------------*/
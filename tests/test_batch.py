@@ -0,0 +1,48 @@
+"""
+Batch scoring of plot inventory frames.
+"""
+import numpy as np
+import pandas as pd
+
+from batch import score_frame, valid_areas
+from vastu import MAX_AREA, VARGA_KEYS, calculate_money_expense, is_good_area, lookup_letter_value, lookup_vastu
+
+BAD_AREAS = ["inf", "-inf", "99999999999999999999", str(MAX_AREA + 1), "0", "-5", "2.5", "abc", None]
+
+
+def test_valid_areas_rejects_out_of_range_and_non_numeric():
+    valid, areas = valid_areas(pd.Series(BAD_AREAS + ["1", "1089", "1089.0", str(MAX_AREA)]))
+    assert valid.tolist() == [False] * len(BAD_AREAS) + [True] * 4
+    assert areas.tolist() == [0] * len(BAD_AREAS) + [1, 1089, 1089, MAX_AREA]
+
+
+def test_rejected_areas_leave_the_scored_columns_null():
+    df = pd.DataFrame({"village": ["కొండాపూర్"] * len(BAD_AREAS), "person": ["రాము"] * len(BAD_AREAS),
+                       "area": BAD_AREAS})
+    out = score_frame(df)
+    scored = list(VARGA_KEYS) + [f"{key}_verdict" for key in VARGA_KEYS] + ["good_area"]
+    assert out[scored].isna().all().all()
+    # The letters do not depend on the area
+    assert out["money"].notna().all()
+
+
+def test_scores_match_the_single_lookups():
+    df = pd.DataFrame({"village": ["కొండాపూర్", "అంకాపూర్", "xyz"], "person": ["కృష్ణ", "క్షమ", "రాము"],
+                       "area": ["1089", "7561.0", "250"]})
+    out = score_frame(df)
+    for i, (village, person, area) in enumerate([("క", "క", 1089), ("అం", "క్ష", 7561)]):
+        assert (out.loc[i, "village_letter"], out.loc[i, "person_letter"]) == (village, person)
+        money, expense = calculate_money_expense(lookup_letter_value(village), lookup_letter_value(person))
+        assert (out.loc[i, "money"], out.loc[i, "expense"]) == (money, expense)
+        values, _, _ = lookup_vastu(area)
+        assert out.loc[i, list(VARGA_KEYS)].astype(int).tolist() == values.tolist()
+        assert out.loc[i, "good_area"] == is_good_area(area)
+    assert pd.isna(out.loc[2, "village_letter"]) and pd.isna(out.loc[2, "money"])
+    assert out.loc[2, "aayam"] == lookup_vastu(250)[0][VARGA_KEYS.index("aayam")]
+
+
+def test_name_cache_is_reused_and_skips_missing_names():
+    caches = {}
+    df = pd.DataFrame({"village": ["కొండాపూర్", np.nan], "person": ["కృష్ణ", "కృష్ణ"], "area": ["10", "20"]})
+    score_frame(df, caches=caches)
+    assert set(caches["letters"]) == {"కొండాపూర్", "కృష్ణ"}
@@ -0,0 +1,88 @@
+"""
+Integer-coded tables and the binary snapshot: loading it must give the same
+tables as rebuilding them from the source modules.
+"""
+import numpy as np
+import pytest
+
+from vastu import compact, engine
+from vastu.calculations import EXPENSE_BY_VALUE, LETTER_GROUPS, MONEY_BY_VALUE
+from vastu.compact import (
+    SNAPSHOT_PATH, StringPool, LetterGroupTable, build_letter_group_table, read_snapshot, snapshot_arrays,
+    write_snapshot
+)
+from vastu.data import letter_range_rashi_dynamic
+from vastu.meanings import MEANINGS
+
+
+@pytest.fixture(scope="module")
+def rebuilt():
+    return snapshot_arrays()
+
+
+def test_committed_snapshot_is_current_and_equals_a_rebuild(rebuilt):
+    snapshot = read_snapshot(SNAPSHOT_PATH)
+    assert snapshot is not None, "tables.snapshot is stale: run python -m vastu.compact build"
+    assert snapshot.keys() == rebuilt.keys()
+    for name, array in rebuilt.items():
+        assert snapshot[name].dtype == array.dtype, name
+        np.testing.assert_array_equal(snapshot[name], array, err_msg=name)
+
+
+def test_loaded_tables_match_the_sources():
+    for col, key in enumerate(engine.VARGA_KEYS):
+        for value in range(1, engine.DIV_VEC[col] + 1):
+            meaning = MEANINGS.get(key, {}).get(value)
+            text = engine.MEANING_BY_VALUE[col, value]
+            assert text == (meaning.text if meaning else engine.MISSING_MEANING)
+            assert engine.VERDICT_BY_VALUE[col, value] == (meaning.verdict if meaning else 0)
+    for letter, groups in letter_range_rashi_dynamic.items():
+        assert [group.as_dict() for group in LETTER_GROUPS.groups(letter)] == \
+            [{**group, "Letters": ", ".join(group["Letters"])} for group in groups]
+
+
+def test_write_read_round_trip(tmp_path, rebuilt):
+    path = str(tmp_path / "tables.snapshot")
+    write_snapshot(rebuilt, path)
+    loaded = read_snapshot(path)
+    for name, array in rebuilt.items():
+        np.testing.assert_array_equal(loaded[name], array, err_msg=name)
+        assert not loaded[name].flags.writeable
+    np.testing.assert_array_equal(loaded["money"], MONEY_BY_VALUE)
+    np.testing.assert_array_equal(loaded["expense"], EXPENSE_BY_VALUE)
+
+
+def test_stale_or_broken_snapshots_are_ignored(tmp_path, rebuilt, monkeypatch):
+    path = str(tmp_path / "tables.snapshot")
+    write_snapshot(rebuilt, path)
+    with open(path, "rb") as f:
+        data = f.read()
+
+    monkeypatch.setattr(compact, "source_fingerprint", lambda: b"\0" * 32)
+    assert read_snapshot(path) is None
+    monkeypatch.undo()
+
+    for broken in (data[:20], data[:-10], b"NOTVASTU" + data[8:]):
+        with open(path, "wb") as f:
+            f.write(broken)
+        assert read_snapshot(path) is None
+    assert read_snapshot(str(tmp_path / "missing.snapshot")) is None
+
+
+def test_string_pool_round_trip():
+    pool = StringPool(["—", "మంచిది", "", "మంచిది", "ధనలాభం"])
+    assert len(pool) == 4
+    assert pool.code("మంచిది") == 1 and pool.code("unknown") == -1
+    restored = StringPool.from_arrays(*pool.to_arrays())
+    assert restored.strings == pool.strings
+    assert pool.array()[[3, 0]].tolist() == ["ధనలాభం", "—"]
+
+
+def test_letter_group_table_round_trip():
+    table = build_letter_group_table(letter_range_rashi_dynamic)
+    restored = LetterGroupTable.from_arrays(table.to_arrays())
+    for letter in letter_range_rashi_dynamic:
+        assert letter in restored
+        assert [group.as_dict() for group in restored.groups(letter)] == \
+            [group.as_dict() for group in table.groups(letter)]
+    assert "xyz" not in restored and restored.groups("xyz") == ()
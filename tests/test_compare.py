@@ -0,0 +1,55 @@
+"""
+Area list parsing and the comparison summary.
+"""
+import numpy as np
+import pytest
+
+from vastu import MAX_AREA, Verdict, compare_areas, comparison_summary, is_good_area, lookup_vastu, parse_areas
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("1089", [1089]),
+    ("1089, 1200 1300-1303", [1089, 1200, 1300, 1301, 1302, 1303]),
+    ("5 - 7;3,5", [5, 6, 7, 3]),
+    ("  ", []),
+    (f"{MAX_AREA}", [MAX_AREA]),
+])
+def test_parses_areas_and_ranges_in_order_without_repeats(text, expected):
+    areas = parse_areas(text)
+    assert areas.dtype == np.int64
+    assert areas.tolist() == expected
+
+
+@pytest.mark.parametrize("text, message", [
+    ("0", "not a valid area range"),
+    ("10-5", "not a valid area range"),
+    ("abc", "not an area"),
+    ("-5", "not an area"),
+    ("12.5", "not an area"),
+    ("1-2-3", "not an area"),
+    (str(MAX_AREA + 1), "larger than the maximum area"),
+    ("99999999999999999999", "larger than the maximum area"),
+    (f"1-{MAX_AREA + 5}", "larger than the maximum area"),
+])
+def test_rejects_bad_tokens(text, message):
+    with pytest.raises(ValueError, match=message):
+        parse_areas(text)
+
+
+def test_limits_the_number_of_areas():
+    assert len(parse_areas("1-10", limit=10)) == 10
+    with pytest.raises(ValueError, match="At most 10"):
+        parse_areas("1-10 20", limit=10)
+
+
+def test_summary_counts_verdicts_per_area():
+    areas = parse_areas("1089 7561 250")
+    values, verdicts = compare_areas(areas)
+    summary = comparison_summary(areas, verdicts)
+    for i, area in enumerate(areas):
+        area_values, area_verdicts, _ = lookup_vastu(area)
+        np.testing.assert_array_equal(values[i], area_values)
+        assert summary["Good"][i] == (area_verdicts == Verdict.GOOD).sum()
+        assert summary["Bad"][i] == (area_verdicts == Verdict.BAD).sum()
+        assert summary["Good Plot"][i] == is_good_area(area)
+    np.testing.assert_array_equal(summary["Area (sq. ft)"], areas)
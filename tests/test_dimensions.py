@@ -0,0 +1,78 @@
+"""
+DimensionSearch against scoring every (width, length) pair directly.
+"""
+import numpy as np
+import pytest
+
+from vastu import DimensionSearch, SCORED_VARGAS, Verdict, VARGA_KEYS, good_areas, lookup_vastu_batch
+
+SOME_VARGAS = SCORED_VARGAS[:3]
+
+
+def brute_force(w_lo, w_hi, l_lo, l_hi, vargas, min_score, good_only):
+    columns = [VARGA_KEYS.index(key) for key in vargas]
+    rows = []
+    for width in range(max(w_lo, 1), w_hi + 1):
+        for length in range(max(l_lo, 1), l_hi + 1):
+            area = width * length
+            if good_only and area not in good_areas:
+                continue
+            _, verdicts, _ = lookup_vastu_batch(np.array([area]))
+            score = int((verdicts[0, columns] == Verdict.GOOD).sum())
+            if score >= min_score:
+                rows.append((width, length, area, score))
+    rows.sort(key=lambda row: (-row[3], row[0], row[1]))
+    return np.array(rows, dtype=np.int64).reshape(-1, 4)
+
+
+CASES = [
+    (1, 12, 1, 15, SCORED_VARGAS, 0, False),
+    (20, 40, 25, 45, SCORED_VARGAS, 4, False),
+    (20, 40, 25, 45, SOME_VARGAS, 2, False),
+    (10, 60, 10, 60, SCORED_VARGAS, 0, True),
+    (10, 60, 10, 60, SOME_VARGAS, 1, True),
+]
+
+
+@pytest.mark.parametrize("w_lo, w_hi, l_lo, l_hi, vargas, min_score, good_only", CASES)
+def test_matches_brute_force(w_lo, w_hi, l_lo, l_hi, vargas, min_score, good_only):
+    expected = brute_force(w_lo, w_hi, l_lo, l_hi, vargas, min_score, good_only)
+    search = DimensionSearch(w_lo, w_hi, l_lo, l_hi, vargas, min_score, good_only)
+    assert len(search) == len(expected)
+    np.testing.assert_array_equal(search.slice(0, len(search)), expected)
+    levels, totals = np.unique(expected[:, 3], return_counts=True)
+    assert search.score_counts() == dict(zip(levels.tolist(), totals.tolist()))
+
+
+@pytest.mark.parametrize("page_size", [1, 7, 50])
+def test_pages_cover_the_ranking(page_size):
+    expected = brute_force(20, 40, 25, 45, SCORED_VARGAS, 3, False)
+    search = DimensionSearch(20, 40, 25, 45, min_score=3)
+    pages = [search.page(page, page_size) for page in range(search.page_count(page_size))]
+    assert all(len(page) == page_size for page in pages[:-1])
+    np.testing.assert_array_equal(np.concatenate(pages), expected)
+    np.testing.assert_array_equal(np.concatenate(list(search.iter_pairs(batch_size=13))), expected)
+
+
+def test_slices_inside_and_across_score_levels():
+    expected = brute_force(1, 12, 1, 15, SCORED_VARGAS, 0, False)
+    search = DimensionSearch(1, 12, 1, 15)
+    for start, stop in [(0, 1), (3, 40), (17, 18), (55, 140), (len(expected) - 5, len(expected) + 5), (-3, 4)]:
+        np.testing.assert_array_equal(search.slice(start, stop), expected[max(start, 0):stop])
+    assert search.slice(20, 10).shape == (0, 4)
+
+
+def test_min_score_above_the_number_of_vargas():
+    search = DimensionSearch(1, 30, 1, 30, SOME_VARGAS, min_score=len(SOME_VARGAS) + 1)
+    assert len(search) == 0
+    assert search.score_counts() == {}
+    assert search.slice(0, 10).shape == (0, 4)
+
+
+@pytest.mark.parametrize("good_only", [False, True])
+def test_empty_when_lo_above_hi(good_only):
+    for search in (DimensionSearch(30, 10, 1, 20, good_only=good_only),
+                   DimensionSearch(1, 20, 30, 10, good_only=good_only)):
+        assert len(search) == 0
+        assert search.page_count() == 0
+        assert search.page(0).shape == (0, 4)
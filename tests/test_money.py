@@ -0,0 +1,48 @@
+"""
+Precomputed money/expense matrices and their vectorized lookups.
+"""
+import numpy as np
+import pytest
+
+from vastu import (
+    LETTER_KEYS, calculate_money_expense, lookup_letter_value, money_expense_grid, money_expense_long,
+    money_expense_pairs, telugu_letters
+)
+from vastu.calculations import _money_expense_formula
+
+LETTERS = ["క", "అం", "క్ష", "గ", "అ"]
+
+
+def test_every_letter_pair_matches_the_formula():
+    money, expense = money_expense_grid(LETTER_KEYS, LETTER_KEYS)
+    assert money.shape == expense.shape == (len(LETTER_KEYS), len(LETTER_KEYS))
+    for i, village in enumerate(LETTER_KEYS):
+        for j, person in enumerate(LETTER_KEYS):
+            expected = _money_expense_formula(telugu_letters[village], telugu_letters[person])
+            assert (money[i, j], expense[i, j]) == expected
+            assert calculate_money_expense(lookup_letter_value(village), lookup_letter_value(person)) == expected
+
+
+def test_grid_rejects_unknown_letters():
+    with pytest.raises(KeyError, match="xyz"):
+        money_expense_grid(["క", "xyz"], ["క"])
+
+
+def test_long_form_is_the_grid_row_by_row():
+    long = money_expense_long(LETTERS, LETTERS[:3])
+    money, expense = money_expense_grid(LETTERS, LETTERS[:3])
+    assert long["village_letter"].tolist() == [v for v in LETTERS for _ in range(3)]
+    assert long["person_letter"].tolist() == LETTERS[:3] * len(LETTERS)
+    np.testing.assert_array_equal(long["money"], money.ravel())
+    np.testing.assert_array_equal(long["expense"], expense.ravel())
+
+
+def test_pairs_flag_unknown_and_missing_letters():
+    villages = np.array(["క", "xyz", None, "అం"], dtype=object)
+    persons = np.array(["గ", "క", "క", "క్ష"], dtype=object)
+    money, expense, known = money_expense_pairs(villages, persons)
+    assert known.tolist() == [True, False, False, True]
+    assert money[~known].tolist() == expense[~known].tolist() == [0, 0]
+    for i in np.flatnonzero(known):
+        expected = calculate_money_expense(lookup_letter_value(villages[i]), lookup_letter_value(persons[i]))
+        assert (money[i], expense[i]) == expected
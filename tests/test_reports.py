@@ -0,0 +1,51 @@
+"""
+Report rendering: Meaning cells wrap inside their column.
+"""
+import pytest
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.font_manager import FontProperties
+
+from reports import _draw_table, _wrap_cell, render_chunk
+from vastu.tables import vastu_items
+
+# Without a Telugu font installed every glyph measured warns
+pytestmark = pytest.mark.filterwarnings("ignore:Glyph .* missing from font")
+
+LONG_MEANING_AREA = 6  # Aayam, Varam and Tatvam all have long meanings here
+
+
+def _text_width(renderer, text, font_size=8):
+    return renderer.get_text_width_height_descent(text, FontProperties(size=font_size), ismath=False)[0]
+
+
+def test_wrapped_lines_fit_the_width():
+    renderer = FigureCanvasAgg(Figure()).get_renderer()
+    for item in vastu_items(LONG_MEANING_AREA):
+        wrapped = _wrap_cell(item["Meaning"], renderer, 8, 150)
+        assert wrapped.replace("\n", " ") == item["Meaning"]
+        assert all(_text_width(renderer, line) <= 150 for line in wrapped.splitlines() if " " in line)
+    assert _wrap_cell("short", renderer, 8, 150) == "short"
+
+
+def test_rows_grow_with_their_wrapped_cells():
+    fig = Figure(figsize=(8.27, 11.69), dpi=100)
+    FigureCanvasAgg(fig)
+    ax = fig.add_axes([0.05, 0.05, 0.9, 0.43])
+    items = vastu_items(LONG_MEANING_AREA)
+    _draw_table(ax, "", ["Vastu Item", "Value", "Meaning", "Verdict"],
+                [[i["Vastu Item"], i["Value"], i["Meaning"], i["Verdict"]] for i in items],
+                col_widths=[0.15, 0.08, 0.5, 0.27], wrap_col=2)
+    cells = ax.tables[0].get_celld()
+    line_height = cells[0, 2].get_height()
+    for row, item in enumerate(items, start=1):
+        lines = cells[row, 2].get_text().get_text().count("\n") + 1
+        assert cells[row, 0].get_height() == cells[row, 2].get_height() == line_height * lines
+    assert max(cells[row, 2].get_height() for row in range(1, len(items) + 1)) > line_height
+
+
+def test_render_chunk_skips_unknown_letters_and_bad_areas(tmp_path):
+    rows = [(0, None, "కొండాపూర్", "రాము", "6"), (1, "plot/7", "కొండాపూర్", "రాము", "1089"),
+            (2, None, "xyz", "రాము", "10"), (3, None, "కొండాపూర్", "రాము", "2.5")]
+    assert render_chunk(rows, str(tmp_path), "png") == (2, 2)
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["000000_6.png", "plot_7.png"]
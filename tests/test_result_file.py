@@ -0,0 +1,60 @@
+"""
+ResultFile write/read round-trip.
+"""
+import numpy as np
+import pytest
+
+from vastu import PERIOD, is_good_area_batch, lookup_vastu_batch
+from vastu.result_file import ResultFile, build_result_file
+
+MAX_AREA = PERIOD + 500
+
+
+@pytest.fixture(scope="module")
+def result_file(tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("results") / "results.bin")
+    # A small chunk size so records are written across several chunks
+    build_result_file(path, MAX_AREA, chunk_size=1000)
+    return ResultFile(path)
+
+
+def test_round_trip_matches_the_engine(result_file):
+    areas = np.arange(MAX_AREA + 1, dtype=np.int64)
+    values, verdicts, _ = lookup_vastu_batch(areas)
+    assert len(result_file) == MAX_AREA + 1
+    np.testing.assert_array_equal(result_file.vargas(0, MAX_AREA + 1), values)
+    np.testing.assert_array_equal(result_file.verdicts(0, MAX_AREA + 1), verdicts)
+    np.testing.assert_array_equal(result_file.good_area(0, MAX_AREA + 1), is_good_area_batch(areas))
+
+
+def test_single_areas_and_gathers(result_file):
+    values, verdicts, _ = lookup_vastu_batch(np.array([1089]))
+    np.testing.assert_array_equal(result_file.vargas(1089), values)
+    np.testing.assert_array_equal(result_file.verdicts(1089), verdicts)
+    areas = [MAX_AREA, 3, 1089, 3]
+    np.testing.assert_array_equal(result_file.take(areas), result_file.records[areas])
+
+
+def test_slices_are_read_only_views(result_file):
+    records = result_file.slice(10, 20)
+    assert len(records) == 10
+    with pytest.raises(ValueError):
+        records["flags"][0] = 1
+
+
+@pytest.mark.parametrize("lo, hi", [(-1, 5), (0, MAX_AREA + 2)])
+def test_slices_outside_the_file_raise(result_file, lo, hi):
+    with pytest.raises(IndexError):
+        result_file.slice(lo, hi)
+
+
+def test_take_outside_the_file_raises(result_file):
+    with pytest.raises(IndexError):
+        result_file.take([1, MAX_AREA + 1])
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"NOTVASTU" + bytes(24))
+    with pytest.raises(ValueError, match="not a version"):
+        ResultFile(str(path))
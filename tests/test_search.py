@@ -0,0 +1,69 @@
+"""
+AreaSearch against a brute-force scan of small ranges.
+"""
+import numpy as np
+import pytest
+
+from vastu import PERIOD, AreaSearch, Verdict, good_areas, lookup_vastu_batch, VARGA_KEYS
+
+CONSTRAINTS = [
+    ({}, {}),
+    ({"aayam": {1, 3, 5, 7}}, {}),
+    ({}, {"thithi": Verdict.GOOD}),
+    ({"aayam": {2, 4, 6, 8}}, {"thithi": Verdict.GOOD, "varam": Verdict.BAD}),
+]
+RANGES = [(1, 500), (PERIOD - 40, PERIOD + 40), (3 * PERIOD - 7, 3 * PERIOD + 900), (1089, 1089)]
+
+
+def brute_force(lo, hi, values, verdicts, good_only):
+    areas = np.arange(lo, hi + 1, dtype=np.int64)
+    if not len(areas):
+        return areas
+    vals, verds, _ = lookup_vastu_batch(areas)
+    keep = np.ones(len(areas), dtype=bool)
+    for varga, allowed in values.items():
+        keep &= np.isin(vals[:, VARGA_KEYS.index(varga)], list(allowed))
+    for varga, verdict in verdicts.items():
+        keep &= verds[:, VARGA_KEYS.index(varga)] == verdict
+    if good_only:
+        keep &= np.isin(areas, list(good_areas))
+    return areas[keep]
+
+
+@pytest.mark.parametrize("good_only", [False, True])
+@pytest.mark.parametrize("values, verdicts", CONSTRAINTS)
+@pytest.mark.parametrize("lo, hi", RANGES)
+def test_matches_brute_force(lo, hi, values, verdicts, good_only):
+    expected = brute_force(lo, hi, values, verdicts, good_only)
+    search = AreaSearch(lo, hi, values, verdicts, good_only)
+    assert len(search) == len(expected)
+    np.testing.assert_array_equal(search.all(), expected)
+
+
+@pytest.mark.parametrize("good_only", [False, True])
+def test_pages_cover_the_results(good_only):
+    expected = brute_force(1, 3000, {}, {"thithi": Verdict.GOOD}, good_only)
+    search = AreaSearch(1, 3000, verdicts={"thithi": Verdict.GOOD}, good_only=good_only)
+    page_size = 7
+    assert search.page_count(page_size) == -(-len(expected) // page_size)
+    pages = [search.page(page, page_size) for page in range(search.page_count(page_size))]
+    assert all(len(page) == page_size for page in pages[:-1])
+    assert 0 < len(pages[-1]) <= page_size
+    np.testing.assert_array_equal(np.concatenate(pages), expected)
+    assert len(search.page(search.page_count(page_size), page_size)) == 0
+
+
+def test_slice_clamps_out_of_range_positions():
+    expected = brute_force(1, 500, {"aayam": {1, 3}}, {}, False)
+    search = AreaSearch(1, 500, values={"aayam": {1, 3}})
+    np.testing.assert_array_equal(search.slice(-5, 3), expected[:3])
+    np.testing.assert_array_equal(search.slice(len(expected) - 2, len(expected) + 10), expected[-2:])
+    assert len(search.slice(10, 5)) == 0
+
+
+@pytest.mark.parametrize("good_only", [False, True])
+def test_empty_when_lo_above_hi(good_only):
+    search = AreaSearch(500, 100, good_only=good_only)
+    assert len(search) == 0
+    assert search.page_count() == 0
+    assert len(search.all()) == 0
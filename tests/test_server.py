@@ -0,0 +1,103 @@
+"""
+Request parsing, dispatch status codes and micro-batch isolation of server.py.
+"""
+import asyncio
+import json
+
+import pytest
+
+from server import BadRequest, MicroBatcher, ScoringServer, parse_score_request, score_batch
+from vastu import MAX_AREA
+
+GOOD_REQUEST = {"village": "కొండాపూర్", "person": "కృష్ణ", "area": 1089}
+
+
+def _parse(response):
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split(b" ", 2)[1]), json.loads(body)
+
+
+def _dispatch(server, body, method="POST", path="/score"):
+    return _parse(asyncio.run(server.dispatch(method, path, body, keep_alive=True)))
+
+
+def test_parse_score_request_accepts_names_or_letters():
+    assert parse_score_request(GOOD_REQUEST) == ("కొండాపూర్", "కృష్ణ", 1089)
+    assert parse_score_request({"village_letter": "క", "person_letter": "గ", "area": MAX_AREA}) == \
+        ("క", "గ", MAX_AREA)
+
+
+@pytest.mark.parametrize("payload", [
+    None, [], "area",
+    {"person": "క", "area": 10},
+    {"village": 1, "person": "క", "area": 10},
+    {"village": "క", "person": "క"},
+    {"village": "క", "person": "క", "area": True},
+    {"village": "క", "person": "క", "area": 10.5},
+    {"village": "క", "person": "క", "area": "10"},
+    {"village": "క", "person": "క", "area": 0},
+    {"village": "క", "person": "క", "area": -3},
+    {"village": "క", "person": "క", "area": MAX_AREA + 1},
+    {"village": "క", "person": "క", "area": 10 ** 20},
+])
+def test_parse_score_request_rejects(payload):
+    with pytest.raises(BadRequest):
+        parse_score_request(payload)
+
+
+def test_dispatch_status_codes():
+    server = ScoringServer(MicroBatcher())
+    assert _dispatch(server, b"{not json")[0] == 400
+    assert _dispatch(server, json.dumps({**GOOD_REQUEST, "area": 10 ** 20}).encode())[0] == 400
+    assert _dispatch(server, b"", path="/other")[0] == 404
+    assert _dispatch(server, b"", method="GET")[0] == 405
+    assert _dispatch(server, b"", method="GET", path="/health") == (200, {"status": "ok", "queued": 0})
+
+
+def test_dispatch_sheds_load_when_the_queue_is_full():
+    async def run():
+        # Never started, so the one queued request stays in the queue
+        server = ScoringServer(MicroBatcher(queue_size=1))
+        server.batcher.submit(("క", "క", 10))
+        return _parse(await server.dispatch("POST", "/score", json.dumps(GOOD_REQUEST).encode(), True))
+
+    status, payload = asyncio.run(run())
+    assert status == 503
+    assert payload == {"error": "Server busy"}
+
+
+def test_dispatch_turns_unexpected_errors_into_500(monkeypatch):
+    server = ScoringServer(MicroBatcher())
+    monkeypatch.setattr(server.batcher, "submit", lambda request: 1 / 0)
+    status, payload = _dispatch(server, json.dumps(GOOD_REQUEST).encode())
+    assert status == 500
+    assert "division by zero" in payload["error"]
+
+
+def test_scored_request_matches_score_batch():
+    async def run():
+        batcher = MicroBatcher(window=0.01)
+        batcher.start()
+        try:
+            return _parse(await ScoringServer(batcher).dispatch(
+                "POST", "/score", json.dumps(GOOD_REQUEST).encode(), True))
+        finally:
+            await batcher.stop()
+
+    status, payload = asyncio.run(run())
+    assert status == 200
+    assert payload == json.loads(json.dumps(score_batch([("కొండాపూర్", "కృష్ణ", 1089)])[0]))
+
+
+def test_a_failing_request_only_fails_its_own_future():
+    async def run():
+        loop = asyncio.get_running_loop()
+        batch = [(("క", "క", 1089), loop.create_future()), (("క", "క", "oops"), loop.create_future()),
+                 (("అం", "గ", 7561), loop.create_future())]
+        MicroBatcher._resolve(batch)
+        return [future for _, future in batch]
+
+    good, bad, other = asyncio.run(run())
+    assert good.result() == score_batch([("క", "క", 1089)])[0]
+    assert other.result() == score_batch([("అం", "గ", 7561)])[0]
+    assert bad.exception() is not None
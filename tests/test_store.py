@@ -0,0 +1,81 @@
+"""
+ReportStore views, bulk rows and history.
+"""
+import itertools
+
+import pandas as pd
+import pytest
+
+from batch import score_file
+from vastu import VARGA_KEYS, Verdict
+from vastu.store import ReportStore, build_record
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    # A strictly increasing clock, so history order never depends on timer resolution
+    clock = itertools.count(1_000_000)
+    monkeypatch.setattr("vastu.store.time.time", lambda: float(next(clock)))
+    store = ReportStore(str(tmp_path / "reports.sqlite3"))
+    yield store
+    store.close()
+
+
+def test_record_view_inserts_then_counts_hits(store):
+    store.record_view("క", "గ", 1089)
+    store.record_view("క", "గ", 1089)
+    record = store.get("క", "గ", 1089)
+    expected = build_record("క", "గ", 1089)
+    assert record["hits"] == 2
+    assert {key: record[key] for key in expected} == expected
+    assert set(record["verdicts"]) == set(VARGA_KEYS)
+    assert all(verdict in tuple(Verdict) for verdict in record["verdicts"].values())
+    assert store.count() == 1
+
+
+def test_get_or_compute_counts_a_view(store):
+    assert store.get("అ", "అ", 10) is None
+    assert store.get_or_compute("అ", "అ", 10)["hits"] == 1
+    assert store.get_or_compute("అ", "అ", 10)["hits"] == 2
+
+
+def test_bulk_rows_stay_out_of_history_until_viewed(store):
+    assert store.bulk_insert(["క", "క", None], ["గ", "గ", "గ"], [100, 200, 300]) == 2
+    assert store.bulk_insert(["క"], ["గ"], [100]) == 0
+    assert store.count() == 0
+    assert store.history() == []
+    assert store.get("క", "గ", 100)["hits"] == 0
+
+    store.record_view("క", "గ", 200)
+    store.record_view("అ", "అ", 5)
+    assert store.count() == 2
+    assert [record["area"] for record in store.history()] == [5, 200]
+    assert store.get("క", "గ", 200)["hits"] == 1
+
+
+def test_history_pages(store):
+    for area in range(1, 8):
+        store.record_view("క", "గ", area)
+    store.record_view("క", "గ", 3)
+    pages = [[record["area"] for record in store.history(page, 3)] for page in range(3)]
+    assert pages == [[3, 7, 6], [5, 4, 2], [1]]
+    assert store.count() == 7
+
+
+def test_count_survives_reopening(tmp_path):
+    path = str(tmp_path / "reports.sqlite3")
+    store = ReportStore(path)
+    store.bulk_insert(["క"] * 3, ["గ"] * 3, [1, 2, 3])
+    store.record_view("క", "గ", 2)
+    store.close()
+    assert ReportStore(path).count() == 1
+
+
+def test_score_file_stores_only_valid_rows(tmp_path):
+    source = tmp_path / "plots.csv"
+    pd.DataFrame({"village": ["కొండాపూర్"] * 5, "person": ["రాము"] * 5,
+                  "area": ["1089", "inf", "99999999999999999999", "0", "2.5"]}).to_csv(source, index=False)
+    store_path = str(tmp_path / "reports.sqlite3")
+    assert score_file(str(source), str(tmp_path / "scored.csv"), store_path=store_path) == 5
+    conn = ReportStore(store_path)._connect()
+    assert conn.execute("SELECT area FROM reports").fetchall() == [(1089,)]
@@ -0,0 +1,40 @@
+"""
+The prebuilt HTML results table against the row builders it replaced.
+"""
+import html
+import re
+
+import pytest
+
+from vastu import PERIOD
+from vastu.tables import html_table, letter_groups_html, vastu_items, vastu_table_html
+
+_ROW = re.compile(r'<tr class="([\w-]+)"><td>(.*?)</td><td>(.*?)</td><td>(.*?)</td><td>(.*?)</td></tr>')
+_CLASSES = {"మంచిది": "good-row", "మంచిదికాదు": "bad-row"}
+
+
+@pytest.mark.parametrize("area", [1, 6, 1089, PERIOD, PERIOD + 1089, 123456789])
+def test_rows_match_vastu_items(area):
+    rows = _ROW.findall(vastu_table_html(area))
+    expected = [
+        (_CLASSES.get(item["Verdict"], "plain-row"), item["Vastu Item"], str(item["Value"]),
+         html.escape(item["Meaning"]), item["Verdict"])
+        for item in vastu_items(area)
+    ]
+    assert rows == expected
+
+
+def test_areas_a_period_apart_share_one_table():
+    assert vastu_table_html(1089) is vastu_table_html(1089 + 3 * PERIOD)
+
+
+def test_html_table_escapes_and_accepts_columns():
+    assert html_table({"a": ["<b>"], "b": [1]}) == \
+        '<table class="vastu-table"><thead><tr><th>a</th><th>b</th></tr></thead>' \
+        "<tbody><tr><td>&lt;b&gt;</td><td>1</td></tr></tbody></table>"
+    assert html_table([]) == '<table class="vastu-table"><thead><tr></tr></thead><tbody></tbody></table>'
+
+
+def test_letter_groups_html_is_empty_for_unknown_letters():
+    assert letter_groups_html("xyz") == ""
+    assert "<td>" in letter_groups_html("క")
@@ -0,0 +1,51 @@
+"""
+leading_akshara against trying every prefix, longest first.
+"""
+import numpy as np
+import pytest
+
+from vastu import first_letters, leading_akshara, letter_variations, telugu_letters
+
+FORMS = {letter: letter for letter in telugu_letters}
+for _letter, _forms in letter_variations.items():
+    FORMS.update((form, _letter) for form in _forms if form != _letter)
+
+
+def brute_force(name):
+    name = name.lstrip()
+    for size in range(len(name), 0, -1):
+        if name[:size] in FORMS:
+            return FORMS[name[:size]], name[:size]
+    return None, ""
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("క్ష", ("క్ష", "క్ష")),
+    ("క్షేత్రపాలుడు", ("క్ష", "క్ష")),
+    ("అం", ("అం", "అం")),
+    ("అంజలి", ("అం", "అం")),
+    ("కృష్ణ", ("క", "కృ")),
+    ("  కృష్ణ", ("క", "కృ")),
+    ("క", ("క", "క")),
+    ("Krishna", (None, "")),
+    ("౧౨", (None, "")),
+    ("్క", (None, "")),
+    ("", (None, "")),
+    ("   ", (None, "")),
+])
+def test_known_names(name, expected):
+    assert leading_akshara(name) == expected
+    assert brute_force(name) == expected
+
+
+def test_every_form_matches_brute_force():
+    for form in FORMS:
+        for name in (form, form + "రావు", " " + form + "ి"):
+            assert leading_akshara(name) == brute_force(name), name
+
+
+def test_first_letters_skips_missing_names():
+    cache = {}
+    names = np.array(["కృష్ణ", float("nan"), None, "Krishna", "అంజలి", "కృష్ణ"], dtype=object)
+    assert first_letters(names, cache).tolist() == ["క", None, None, None, "అం", "క"]
+    assert set(cache) == {"కృష్ణ", "Krishna", "అంజలి"}
@@ -0,0 +1,29 @@
+"""
+Pure compute core of the Vastu application.
+
+Importing this package loads only the standard library and NumPy, so batch
+workers and services can use it without the Streamlit, pandas or Plotly
+stacks. Chart builders live in vastu.charts and import Plotly on first use.
+"""
+from .data import (
+    telugu_letters, letter_variations, letter_range_rashi_dynamic,
+    mul, div, CSUB, CVFMAE, meaning_map, good_areas
+)
+from .meanings import (
+    Verdict, VERDICT_LABELS, Meaning, MEANINGS, MEANING_ISSUES, parse_meaning, get_meaning, warn_meaning_issues
+)
+from .engine import (
+    VARGA_KEYS, PERIOD, MAX_AREA, VALUE_TABLE, VERDICT_TABLE, MEANING_POOL, MEANING_CODE_TABLE,
+    calculate_vastu_batch, lookup_vastu, lookup_vastu_batch, vastu_row_to_dict,
+    is_good_area, is_good_area_batch, nearest_good_area_above, nearest_good_area_below,
+    good_areas_between
+)
+from .calculations import (
+    lookup_letter_value, first_letter, calculate_money_expense, calculate_vastu, get_letter_group_info,
+    LETTER_KEYS, MONEY_MATRIX, EXPENSE_MATRIX, LETTER_GROUPS, letter_indices,
+    money_expense_grid, money_expense_long, money_expense_pairs
+)
+from .tokenizer import LetterTrie, LETTER_TRIE, build_letter_trie, leading_akshara, first_letters
+from .search import AreaSearch, build_period_mask, search_areas
+from .dimensions import DimensionSearch, SCORED_VARGAS, residue_scores
+from .compare import MAX_COMPARE_AREAS, parse_areas, compare_areas, comparison_summary
@@ -0,0 +1,129 @@
+import numpy as np
+
+from .compact import SNAPSHOT, LetterGroupTable, build_letter_group_table, build_money_tables
+from .data import telugu_letters, CSUB, CVFMAE, letter_range_rashi_dynamic
+from .engine import calculate_vastu_batch, vastu_row_to_dict
+from .tokenizer import leading_akshara
+
+# -----------------------------
+# Helper Functions
+# -----------------------------
+def lookup_letter_value(letter):
+    return telugu_letters.get(letter, 0)
+
+
+def first_letter(name):
+    """
+    Returns the leading letter of a Telugu name as a key of telugu_letters,
+    or None when the name does not start with a known letter.
+    """
+    return leading_akshara(name)[0]
+
+
+def _money_expense_formula(v_val, n_val):
+    v_minus = v_val - CSUB
+    n_minus = n_val - CSUB
+    Money = v_minus if v_minus != 0 else 52
+    Person_Name = n_minus if n_minus != 0 else 52
+    money_concat = int(f"{Money}{Person_Name}")
+    expense_concat = int(f"{Person_Name}{Money}")
+    Money_Value = money_concat % CVFMAE
+    Expense_Value = expense_concat % CVFMAE
+    return Money_Value, Expense_Value
+
+
+# -----------------------------
+# Money & Expense Matrix
+# -----------------------------
+# Every (village, person) letter value pair, indexed [v_val, n_val]
+_MAX_LETTER_VALUE = max(telugu_letters.values())
+if SNAPSHOT is not None:
+    MONEY_BY_VALUE, EXPENSE_BY_VALUE = SNAPSHOT["money"], SNAPSHOT["expense"]
+else:
+    MONEY_BY_VALUE, EXPENSE_BY_VALUE = build_money_tables(_money_expense_formula, _MAX_LETTER_VALUE)
+MONEY_BY_VALUE.setflags(write=False)
+EXPENSE_BY_VALUE.setflags(write=False)
+
+# The same tables indexed by position in LETTER_KEYS
+LETTER_KEYS = tuple(telugu_letters.keys())
+LETTER_INDEX = {letter: i for i, letter in enumerate(LETTER_KEYS)}
+_LETTER_VALUES = np.array([telugu_letters[letter] for letter in LETTER_KEYS], dtype=np.int64)
+MONEY_MATRIX = MONEY_BY_VALUE[np.ix_(_LETTER_VALUES, _LETTER_VALUES)]
+EXPENSE_MATRIX = EXPENSE_BY_VALUE[np.ix_(_LETTER_VALUES, _LETTER_VALUES)]
+MONEY_MATRIX.setflags(write=False)
+EXPENSE_MATRIX.setflags(write=False)
+
+
+def calculate_money_expense(v_val, n_val):
+    if 0 < v_val <= _MAX_LETTER_VALUE and 0 < n_val <= _MAX_LETTER_VALUE:
+        return int(MONEY_BY_VALUE[v_val, n_val]), int(EXPENSE_BY_VALUE[v_val, n_val])
+    return _money_expense_formula(v_val, n_val)
+
+
+def letter_indices(letters):
+    """
+    Returns the LETTER_KEYS position of every letter, or -1 when unknown.
+    """
+    return np.fromiter((LETTER_INDEX.get(letter, -1) for letter in letters),
+                       dtype=np.int64, count=len(letters))
+
+
+def _known_indices(letters):
+    indices = letter_indices(letters)
+    if (indices < 0).any():
+        unknown = [letter for letter, i in zip(letters, indices) if i < 0]
+        raise KeyError(f"Unknown letters: {unknown}")
+    return indices
+
+
+def money_expense_grid(village_letters, person_letters):
+    """
+    Returns (money, expense) arrays of shape (len(village_letters),
+    len(person_letters)) scoring every village letter against every person letter.
+    """
+    rows, cols = np.ix_(_known_indices(village_letters), _known_indices(person_letters))
+    return MONEY_MATRIX[rows, cols], EXPENSE_MATRIX[rows, cols]
+
+
+def money_expense_long(village_letters, person_letters):
+    """
+    Same as money_expense_grid in long form: a dict of equal length columns
+    village_letter, person_letter, money and expense with one entry per pair.
+    """
+    money, expense = money_expense_grid(village_letters, person_letters)
+    return {
+        "village_letter": np.repeat(np.asarray(village_letters, dtype=object), len(person_letters)),
+        "person_letter": np.tile(np.asarray(person_letters, dtype=object), len(village_letters)),
+        "money": money.ravel(),
+        "expense": expense.ravel(),
+    }
+
+
+def money_expense_pairs(village_letters, person_letters):
+    """
+    Scores row aligned letter arrays. Returns (money, expense, known) where
+    known is False for rows with an unknown letter; their values are 0.
+    """
+    v_idx, n_idx = letter_indices(village_letters), letter_indices(person_letters)
+    known = (v_idx >= 0) & (n_idx >= 0)
+    money = np.where(known, MONEY_MATRIX[v_idx, n_idx], 0)
+    expense = np.where(known, EXPENSE_MATRIX[v_idx, n_idx], 0)
+    return money, expense, known
+
+
+def calculate_vastu(area):
+    return vastu_row_to_dict(calculate_vastu_batch([area])[0])
+
+
+# Rashi & nakshatram groups per letter, as pooled LetterGroup records
+if SNAPSHOT is not None:
+    LETTER_GROUPS = LetterGroupTable.from_arrays(SNAPSHOT)
+else:
+    LETTER_GROUPS = build_letter_group_table(letter_range_rashi_dynamic)
+
+
+def get_letter_group_info(selected_letter):
+    """
+    Returns letters grouped together, with their Rashi and Nakshatram
+    """
+    return [group.as_dict() for group in LETTER_GROUPS.groups(selected_letter)]
@@ -0,0 +1,128 @@
+"""
+Chart builders for the results page. Plotly is imported only when a figure
+object is built, so importing this module stays cheap.
+"""
+from .data import div
+from .engine import VARGA_KEYS, VERDICT_BY_VALUE
+from .meanings import VERDICT_LABELS, Verdict
+
+VERDICT_COLORS = {Verdict.NONE: 'grey', Verdict.GOOD: 'green', Verdict.BAD: 'red'}
+
+
+def _radar_points(vastu_results):
+    categories = [key.capitalize() for key in vastu_results.keys()]
+    values = [vastu_results[key] for key in vastu_results.keys()]
+    verdicts = [
+        Verdict(VERDICT_BY_VALUE[VARGA_KEYS.index(key), vastu_results[key]])
+        for key in vastu_results.keys()
+    ]
+    colors = [VERDICT_COLORS[verdict] for verdict in verdicts]
+    labels = [verdict.label for verdict in verdicts]
+    # Repeat the first point to close the polygon
+    return categories + categories[:1], values + values[:1], colors + colors[:1], labels + labels[:1]
+
+
+def create_radar_chart_plotly(vastu_results, single_trace=True):
+    """
+    Builds the radar chart. single_trace draws the outline and the verdict
+    coloured markers as one trace; otherwise each marker is its own trace.
+    """
+    import plotly.graph_objects as go
+
+    theta, values, colors, labels = _radar_points(vastu_results)
+
+    fig = go.Figure()
+    if single_trace:
+        fig.add_trace(go.Scatterpolar(
+            r=values,
+            theta=theta,
+            mode='lines+markers',
+            fill='toself',
+            line_color='blue',
+            fillcolor='rgba(0,0,255,0.1)',
+            marker=dict(color=colors, size=10),
+            customdata=labels,
+            hovertemplate='%{theta}: %{r} (%{customdata})<extra></extra>'
+        ))
+    else:
+        fig.add_trace(go.Scatterpolar(
+            r=values,
+            theta=theta,
+            fill='toself',
+            line_color='blue',
+            fillcolor='rgba(0,0,255,0.1)',
+            hovertemplate='%{theta}: %{r}<extra></extra>'
+        ))
+
+        for i, val in enumerate(values[:-1]):
+            fig.add_trace(go.Scatterpolar(
+                r=[val],
+                theta=[theta[i]],
+                mode='markers',
+                marker=dict(color=colors[i], size=10),
+                showlegend=False,
+                hovertemplate=f"{theta[i]}: {val}<extra></extra>"
+            ))
+
+    fig.update_layout(
+        polar=dict(radialaxis=dict(visible=True, range=[0, max(div.values())])),
+        showlegend=False,
+        margin=dict(l=20, r=20, t=20, b=20),
+        height=350,
+        width=400
+    )
+    return fig
+
+
+def update_radar_figure(base_fig, vastu_results):
+    """
+    Returns a figure dict that reuses base_fig's layout and trace styling and
+    replaces only the point values, colours and verdict labels.
+    base_fig is a single-trace radar as a dict and is not modified.
+    """
+    theta, values, colors, labels = _radar_points(vastu_results)
+    trace = base_fig["data"][0]
+    return {
+        "data": [dict(trace, r=values, theta=theta, customdata=labels,
+                      marker=dict(trace["marker"], color=colors))],
+        "layout": base_fig["layout"],
+    }
+
+
+def create_comparison_heatmap(areas, values, verdicts):
+    """
+    Builds one heatmap of areas x vargas coloured by verdict, with the
+    varga value written in each cell. values and verdicts are (n, 16)
+    matrices aligned with areas.
+    """
+    import numpy as np
+    import plotly.graph_objects as go
+
+    # Three flat bands so verdict codes 0, 1 and 2 map to fixed colours
+    colorscale = []
+    for verdict in (Verdict.NONE, Verdict.GOOD, Verdict.BAD):
+        colorscale += [[verdict / 3, VERDICT_COLORS[verdict]], [(verdict + 1) / 3, VERDICT_COLORS[verdict]]]
+    labels = np.array(VERDICT_LABELS, dtype=object)[verdicts]
+
+    fig = go.Figure(go.Heatmap(
+        z=verdicts,
+        x=[key.capitalize() for key in VARGA_KEYS],
+        y=[str(area) for area in areas],
+        zmin=-0.5,
+        zmax=2.5,
+        colorscale=colorscale,
+        showscale=False,
+        xgap=1,
+        ygap=1,
+        text=values,
+        texttemplate='%{text}' if len(areas) <= 60 else None,
+        customdata=labels,
+        hovertemplate='%{y} sq. ft, %{x}: %{text} (%{customdata})<extra></extra>'
+    ))
+    fig.update_layout(
+        yaxis=dict(type='category', autorange='reversed', title='Area (sq. ft)'),
+        xaxis=dict(side='top'),
+        margin=dict(l=20, r=20, t=40, b=20),
+        height=min(max(200, 22 * len(areas) + 80), 2000)
+    )
+    return fig
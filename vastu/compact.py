@@ -0,0 +1,288 @@
+"""
+Integer-coded form of the static tables, and a binary snapshot that loads
+them without re-deriving anything.
+
+Repeated strings (meanings, rashis, nakshatrams, letter lists) are stored
+once in a StringPool and referred to by small integer codes. Letter groups
+are kept in CSR form: the groups of the i-th letter are rows
+offsets[i]:offsets[i + 1] of the group code matrix.
+
+The snapshot is tables.snapshot next to this module. Rebuild it with
+
+    python -m vastu.compact build
+
+It is ignored, and the tables are built from vastu.data instead, whenever
+one of the modules it was derived from has changed since it was written.
+"""
+import hashlib
+import os
+import struct
+import sys
+
+import numpy as np
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+SNAPSHOT_PATH = os.path.join(_HERE, "tables.snapshot")
+_SOURCES = ("data.py", "meanings.py", "calculations.py", "engine.py", "compact.py")
+_MAGIC = b"VASTUSNP"
+_VERSION = 1
+_HEADER = struct.Struct("<8sH32sH")  # magic, version, source fingerprint, array count
+_ENTRY = struct.Struct("<HQ")       # metadata length, data length
+
+
+def _code_dtype(size):
+    return np.uint8 if size <= 256 else np.uint16
+
+
+# -----------------------------
+# String Pools & Records
+# -----------------------------
+class StringPool:
+    """
+    Deduplicated strings addressed by integer code
+    """
+    __slots__ = ("strings", "_codes")
+
+    def __init__(self, strings=()):
+        self.strings = []
+        self._codes = {}
+        for string in strings:
+            self.intern(string)
+
+    def intern(self, string):
+        code = self._codes.get(string)
+        if code is None:
+            code = self._codes[string] = len(self.strings)
+            self.strings.append(string)
+        return code
+
+    def code(self, string, default=-1):
+        return self._codes.get(string, default)
+
+    def __getitem__(self, code):
+        return self.strings[code]
+
+    def __len__(self):
+        return len(self.strings)
+
+    def array(self):
+        """
+        Returns the strings as an object array, so code arrays can index it
+        """
+        out = np.empty(len(self.strings), dtype=object)
+        out[:] = self.strings
+        return out
+
+    def to_arrays(self):
+        """
+        Returns (UTF-8 blob, offsets) with string i at blob[offsets[i]:offsets[i + 1]]
+        """
+        encoded = [string.encode("utf-8") for string in self.strings]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.uint32)
+        offsets[1:] = np.cumsum([len(data) for data in encoded])
+        return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+    @classmethod
+    def from_arrays(cls, blob, offsets):
+        data = blob.tobytes()
+        offsets = offsets.tolist()
+        return cls(data[start:stop].decode("utf-8") for start, stop in zip(offsets, offsets[1:]))
+
+
+class LetterGroup:
+    __slots__ = ("letters", "rashi", "nakshatram")
+
+    def __init__(self, letters, rashi, nakshatram):
+        self.letters = letters
+        self.rashi = rashi
+        self.nakshatram = nakshatram
+
+    def as_dict(self):
+        return {"Letters": self.letters, "Rashi": self.rashi, "Nakshatram": self.nakshatram}
+
+    def __repr__(self):
+        return f"LetterGroup({self.letters!r}, {self.rashi!r}, {self.nakshatram!r})"
+
+
+class LetterGroupTable:
+    """
+    Rashi & nakshatram groups per letter. codes has one (letters, rashi,
+    nakshatram) row per group, indexing the three pools.
+    """
+    __slots__ = ("keys", "offsets", "codes", "letters", "rashis", "nakshatrams", "_records")
+
+    def __init__(self, keys, offsets, codes, letters, rashis, nakshatrams):
+        self.keys, self.offsets, self.codes = keys, offsets, codes
+        self.letters, self.rashis, self.nakshatrams = letters, rashis, nakshatrams
+        bounds = offsets.tolist()
+        self._records = tuple(
+            tuple(LetterGroup(letters[l], rashis[r], nakshatrams[n]) for l, r, n in codes[start:stop].tolist())
+            for start, stop in zip(bounds, bounds[1:])
+        )
+
+    def groups(self, letter):
+        """
+        Returns the LetterGroup records of a letter; empty when it has none
+        """
+        code = self.keys.code(letter)
+        return self._records[code] if code >= 0 else ()
+
+    def __contains__(self, letter):
+        return self.keys.code(letter) >= 0
+
+    def to_arrays(self):
+        arrays = {"group_offsets": self.offsets, "group_codes": self.codes}
+        for name, pool in (("group_keys", self.keys), ("group_letters", self.letters),
+                           ("rashis", self.rashis), ("nakshatrams", self.nakshatrams)):
+            arrays[f"{name}.blob"], arrays[f"{name}.offsets"] = pool.to_arrays()
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays):
+        pools = [StringPool.from_arrays(arrays[f"{name}.blob"], arrays[f"{name}.offsets"])
+                 for name in ("group_keys", "group_letters", "rashis", "nakshatrams")]
+        return cls(pools[0], arrays["group_offsets"], arrays["group_codes"], *pools[1:])
+
+
+# -----------------------------
+# Builders
+# -----------------------------
+def build_letter_group_table(groups_by_letter):
+    """
+    Builds the table from {letter: [{"Letters": [...], "Rashi": ..., "Nakshatram": ...}]}
+    """
+    keys, letters, rashis, nakshatrams = StringPool(), StringPool(), StringPool(), StringPool()
+    offsets, rows = [0], []
+    for key, groups in groups_by_letter.items():
+        keys.intern(key)
+        for group in groups:
+            rows.append((letters.intern(", ".join(group["Letters"])),
+                         rashis.intern(group["Rashi"]), nakshatrams.intern(group["Nakshatram"])))
+        offsets.append(len(rows))
+    dtype = _code_dtype(max(len(letters), len(rashis), len(nakshatrams)))
+    codes = np.array(rows, dtype=dtype).reshape(-1, 3)
+    return LetterGroupTable(keys, np.array(offsets, dtype=np.uint32), codes, letters, rashis, nakshatrams)
+
+
+def build_meaning_codes(meanings, varga_keys, max_value, missing):
+    """
+    Returns (pool, codes, verdicts) where codes[column, value] indexes the
+    meaning text in pool (code 0 is missing) and verdicts holds its Verdict.
+    """
+    pool = StringPool([missing])
+    codes = np.zeros((len(varga_keys), max_value + 1), dtype=np.uint32)
+    verdicts = np.zeros((len(varga_keys), max_value + 1), dtype=np.int8)
+    for col, key in enumerate(varga_keys):
+        for value, meaning in meanings.get(key, {}).items():
+            if 0 < value <= max_value:
+                codes[col, value] = pool.intern(meaning.text)
+                verdicts[col, value] = meaning.verdict
+    return pool, codes.astype(_code_dtype(len(pool))), verdicts
+
+
+def build_money_tables(formula, max_value):
+    """
+    Returns (money, expense) tables indexed [v_val, n_val] for values 1..max_value
+    """
+    money = np.zeros((max_value + 1, max_value + 1), dtype=np.int8)
+    expense = np.zeros_like(money)
+    for v_val in range(1, max_value + 1):
+        for n_val in range(1, max_value + 1):
+            money[v_val, n_val], expense[v_val, n_val] = formula(v_val, n_val)
+    return money, expense
+
+
+# -----------------------------
+# Binary Snapshot
+# -----------------------------
+def source_fingerprint():
+    """
+    Returns a digest of the modules the snapshot is derived from, or None
+    when their sources are not available
+    """
+    digest = hashlib.sha256()
+    try:
+        for name in _SOURCES:
+            with open(os.path.join(_HERE, name), "rb") as f:
+                digest.update(f.read())
+    except OSError:
+        return None
+    return digest.digest()
+
+
+def write_snapshot(arrays, path=SNAPSHOT_PATH):
+    fingerprint = source_fingerprint()
+    if fingerprint is None:
+        raise FileNotFoundError("Snapshot sources are not available")
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, fingerprint, len(arrays)))
+        for name, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            meta = f"{name}\0{array.dtype.str}\0{','.join(map(str, array.shape))}".encode("utf-8")
+            f.write(_ENTRY.pack(len(meta), array.nbytes))
+            f.write(meta)
+            f.write(array.tobytes())
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path=SNAPSHOT_PATH):
+    """
+    Returns {name: read-only array} from a snapshot, or None when it is
+    missing, malformed or older than its sources
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version, fingerprint, count = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION or fingerprint != source_fingerprint():
+            return None
+        arrays, pos = {}, _HEADER.size
+        for _ in range(count):
+            meta_len, nbytes = _ENTRY.unpack_from(data, pos)
+            pos += _ENTRY.size
+            name, dtype, shape = data[pos:pos + meta_len].decode("utf-8").split("\0")
+            pos += meta_len
+            dtype = np.dtype(dtype)
+            shape = tuple(int(n) for n in shape.split(",") if n)
+            arrays[name] = np.frombuffer(data, dtype=dtype, count=nbytes // dtype.itemsize,
+                                         offset=pos).reshape(shape)
+            pos += nbytes
+        return arrays
+    except (OSError, struct.error, ValueError):
+        return None
+
+
+SNAPSHOT = read_snapshot()
+
+
+def snapshot_arrays():
+    """
+    Builds every snapshotted table from the source modules
+    """
+    from .calculations import _MAX_LETTER_VALUE, _money_expense_formula
+    from .data import letter_range_rashi_dynamic
+    from .engine import VARGA_KEYS, MISSING_MEANING, _max_value
+    from .meanings import MEANINGS
+
+    pool, codes, verdicts = build_meaning_codes(MEANINGS, VARGA_KEYS, _max_value, MISSING_MEANING)
+    money, expense = build_money_tables(_money_expense_formula, _MAX_LETTER_VALUE)
+    arrays = {"meaning_codes": codes, "verdicts": verdicts, "money": money, "expense": expense}
+    arrays["meanings.blob"], arrays["meanings.offsets"] = pool.to_arrays()
+    arrays.update(build_letter_group_table(letter_range_rashi_dynamic).to_arrays())
+    return arrays
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] != ["build"]:
+        print("usage: python -m vastu.compact build [PATH]", file=sys.stderr)
+        return 2
+    path = argv[1] if len(argv) > 1 else SNAPSHOT_PATH
+    write_snapshot(snapshot_arrays(), path)
+    print(f"Wrote {os.path.getsize(path)} bytes -> {path}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+"""
+Side-by-side comparison of candidate areas: every area is looked up in one
+batch, and each gets a summary of its verdict counts.
+"""
+import re
+
+import numpy as np
+
+from .engine import MAX_AREA, lookup_vastu_batch, is_good_area_batch
+from .meanings import Verdict
+
+MAX_COMPARE_AREAS = 1000
+_TOKEN = re.compile(r"^(\d+)(?:-(\d+))?$")
+
+
+def parse_areas(text, limit=MAX_COMPARE_AREAS):
+    """
+    Parses a list of areas and ranges such as "1089, 1200 1300-1320" into
+    an array of areas in the order given, without repeats. Raises
+    ValueError for anything that is not a positive area or range, for
+    areas above MAX_AREA, or when more than limit areas are given.
+    """
+    areas = []
+    text = re.sub(r"\s*-\s*", "-", text.strip())
+    for token in re.split(r"[,;\s]+", text):
+        if not token:
+            continue
+        match = _TOKEN.match(token)
+        if match is None:
+            raise ValueError(f"'{token}' is not an area or a range like 1200-1300")
+        lo = int(match.group(1))
+        hi = int(match.group(2) or lo)
+        if lo < 1 or hi < lo:
+            raise ValueError(f"'{token}' is not a valid area range")
+        if hi > MAX_AREA:
+            raise ValueError(f"'{token}' is larger than the maximum area {MAX_AREA}")
+        if len(areas) + hi - lo + 1 > limit:
+            raise ValueError(f"At most {limit} areas can be compared")
+        areas.extend(range(lo, hi + 1))
+    return np.asarray(list(dict.fromkeys(areas)), dtype=np.int64)
+
+
+def compare_areas(areas):
+    """
+    Returns (values, verdicts) as (n, 16) matrices for an array of areas
+    """
+    values, verdicts, _ = lookup_vastu_batch(areas)
+    return values, verdicts
+
+
+def comparison_summary(areas, verdicts):
+    """
+    Returns the summary table columns: good and bad verdict counts per area
+    and whether it is a good plot
+    """
+    return {
+        "Area (sq. ft)": np.asarray(areas),
+        "Good": (verdicts == Verdict.GOOD).sum(axis=1),
+        "Bad": (verdicts == Verdict.BAD).sum(axis=1),
+        "Good Plot": is_good_area_batch(areas),
+    }
@@ -123,7 +123,7 @@ letter_range_rashi_dynamic = {
     ],
     "ల": [
         {"Letters": ["లి", "లూ", "లే", "లో"], "Rashi": "Mesha (Aries)", "Nakshatram": "Bharani"},
-        {"Letters": ["లా"], "Rashi": "Mesha (Aries)", "Nakshatram": "Ashwini"}]
+        {"Letters": ["లా"], "Rashi": "Mesha (Aries)", "Nakshatram": "Ashwini"}],
     "వ": [
         {"Letters": ["వా", "వి", "వు"], "Rashi": "Vrishabha (Taurus)", "Nakshatram": "Rohini"},
         {"Letters": ["వే", "వో", "వొ"], "Rashi": "Vrishabha (Taurus)", "Nakshatram": "Mrigasira"}
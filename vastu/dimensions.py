@@ -0,0 +1,123 @@
+"""
+Width x length search: rank every (w, l) pair in two ranges by how many of
+the chosen vargas are good for the area w * l.
+
+Scores come from a per-residue table over one PERIOD, so a pair costs one
+index. Pairs are never materialised all at once: each width row is scored
+with one vectorized pass to count matches per score level. Those counts
+let a page of the ranked results be located directly, and only the rows on
+that page are scored again.
+"""
+import numpy as np
+
+from .engine import VARGA_KEYS, PERIOD, VERDICT_TABLE, GOOD_AREAS_SORTED, is_good_area_batch
+from .meanings import MEANINGS, Verdict
+
+# Vargas whose verdicts can be good; the others never add to a score
+SCORED_VARGAS = tuple(key for key in VARGA_KEYS if key in MEANINGS)
+_GOOD = VERDICT_TABLE == Verdict.GOOD
+
+
+def residue_scores(vargas=SCORED_VARGAS):
+    """
+    Returns the number of good verdicts among vargas for every area % PERIOD
+    """
+    columns = [VARGA_KEYS.index(key) for key in vargas]
+    return _GOOD[:, columns].sum(axis=1).astype(np.uint8)
+
+
+class DimensionSearch:
+    """
+    All (width, length) pairs with widths in [w_lo, w_hi] and lengths in
+    [l_lo, l_hi] scoring at least min_score, ranked by score (highest
+    first), then width, then length. good_only keeps only products that
+    are in good_areas.
+    """
+
+    def __init__(self, w_lo, w_hi, l_lo, l_hi, vargas=SCORED_VARGAS, min_score=0, good_only=False):
+        self.vargas = tuple(vargas)
+        self.min_score = min_score
+        self.good_only = good_only
+        self._scores = residue_scores(self.vargas)
+        self._lengths = np.arange(max(l_lo, 1), l_hi + 1, dtype=np.int64)
+        widths = np.arange(max(w_lo, 1), w_hi + 1, dtype=np.int64)
+        if good_only and len(self._lengths):
+            # No product above the largest good area can qualify
+            widths = widths[widths * self._lengths[0] <= GOOD_AREAS_SORTED[-1]]
+        self._widths = widths
+
+        self._levels = np.arange(len(self.vargas), min_score - 1, -1)
+        self._counts = np.zeros((len(self._widths), len(self.vargas) + 1), dtype=np.int64)
+        for row in range(len(self._widths)):
+            scores = self._row_scores(row)[1]
+            self._counts[row] = np.bincount(scores, minlength=len(self.vargas) + 1)
+        self._counts[:, :max(min_score, 0)] = 0
+        self._level_totals = self._counts[:, self._levels].sum(axis=0) if len(self._levels) else np.zeros(0)
+
+    def _row_scores(self, row):
+        """
+        Returns (lengths, scores) for the qualifying lengths of a width row
+        """
+        lengths = self._lengths
+        if self.good_only:
+            limit = GOOD_AREAS_SORTED[-1] // self._widths[row]
+            lengths = lengths[:np.searchsorted(lengths, limit, side="right")]
+        areas = self._widths[row] * lengths
+        scores = self._scores[areas % PERIOD]
+        keep = scores >= self.min_score
+        if self.good_only:
+            keep &= is_good_area_batch(areas)
+        return lengths[keep], scores[keep]
+
+    def __len__(self):
+        return int(self._level_totals.sum())
+
+    def score_counts(self):
+        """
+        Returns {score: number of pairs} for every score level present
+        """
+        return {int(level): int(total) for level, total in zip(self._levels, self._level_totals) if total}
+
+    def slice(self, start, stop):
+        """
+        Returns an (n, 4) array of [width, length, area, score] rows for
+        ranked positions start..stop-1.
+        """
+        start, stop = max(start, 0), min(stop, len(self))
+        out = []
+        position = 0
+        for level, total in zip(self._levels, self._level_totals):
+            if position + total <= start:
+                position += total
+                continue
+            row_ends = position + np.cumsum(self._counts[:, level])
+            row = int(np.searchsorted(row_ends, start, side="right"))
+            while row < len(self._widths) and position < stop:
+                row_start = row_ends[row] - self._counts[row, level]
+                if self._counts[row, level]:
+                    lengths, scores = self._row_scores(row)
+                    lengths = lengths[scores == level]
+                    lo, hi = max(start - row_start, 0), min(stop - row_start, len(lengths))
+                    lengths = lengths[lo:hi]
+                    width = self._widths[row]
+                    out.append(np.column_stack([
+                        np.full(len(lengths), width), lengths, width * lengths, np.full(len(lengths), level)
+                    ]))
+                position = row_ends[row]
+                row += 1
+            if position >= stop:
+                break
+        return np.concatenate(out) if out else np.empty((0, 4), dtype=np.int64)
+
+    def page(self, page, page_size=50):
+        return self.slice(page * page_size, (page + 1) * page_size)
+
+    def page_count(self, page_size=50):
+        return -(-len(self) // page_size)
+
+    def iter_pairs(self, batch_size=1024):
+        """
+        Streams ranked [width, length, area, score] rows in batches
+        """
+        for start in range(0, len(self), batch_size):
+            yield self.slice(start, start + batch_size)
@@ -0,0 +1,148 @@
+import math
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+from .data import mul, div, good_areas
+from .compact import SNAPSHOT, StringPool, build_meaning_codes
+from .meanings import MEANINGS
+
+# -----------------------------
+# Shodasha Varga vectors
+# -----------------------------
+# Column order of every result matrix follows the key order of Data.mul
+VARGA_KEYS = tuple(mul.keys())
+MUL_VEC = np.array([mul[key] for key in VARGA_KEYS], dtype=np.int64)
+DIV_VEC = np.array([div[key] for key in VARGA_KEYS], dtype=np.int64)
+
+# Every varga is (area * mul) % div, so the whole vector repeats with this period
+PERIOD = math.lcm(*(div[key] // math.gcd(mul[key], div[key]) for key in VARGA_KEYS))
+
+MISSING_MEANING = "—"
+
+# Largest area accepted from user input: far beyond any real plot, and small
+# enough that every batch stays inside int64
+MAX_AREA = 10 ** 12
+
+
+def _compute_vastu_batch(areas):
+    areas = np.asarray(areas, dtype=np.int64).reshape(-1)
+    computed = (areas[:, None] * MUL_VEC) % DIV_VEC
+    return np.where(computed == 0, DIV_VEC, computed)
+
+
+def _frozen(array):
+    array.setflags(write=False)
+    return array
+
+
+# -----------------------------
+# Periodic Lookup Tables
+# -----------------------------
+# Per-varga tables indexed by [column, value]; values run from 1 to div.
+# Meanings are codes into MEANING_POOL; code 0 is MISSING_MEANING.
+_max_value = int(DIV_VEC.max())
+if SNAPSHOT is not None:
+    MEANING_POOL = StringPool.from_arrays(SNAPSHOT["meanings.blob"], SNAPSHOT["meanings.offsets"]).array()
+    MEANING_CODE_BY_VALUE, VERDICT_BY_VALUE = SNAPSHOT["meaning_codes"], SNAPSHOT["verdicts"]
+else:
+    _pool, MEANING_CODE_BY_VALUE, VERDICT_BY_VALUE = build_meaning_codes(
+        MEANINGS, VARGA_KEYS, _max_value, MISSING_MEANING
+    )
+    MEANING_POOL = _pool.array()
+_frozen(MEANING_POOL)
+_frozen(MEANING_CODE_BY_VALUE)
+_frozen(VERDICT_BY_VALUE)
+MEANING_BY_VALUE = _frozen(MEANING_POOL[MEANING_CODE_BY_VALUE])
+
+# Full result tables indexed by area % PERIOD, built once at import
+_columns = np.arange(len(VARGA_KEYS))
+VALUE_TABLE = _frozen(_compute_vastu_batch(np.arange(PERIOD)).astype(np.uint8))
+VERDICT_TABLE = _frozen(VERDICT_BY_VALUE[_columns, VALUE_TABLE])
+MEANING_CODE_TABLE = _frozen(MEANING_CODE_BY_VALUE[_columns, VALUE_TABLE])
+
+
+def __getattr__(name):
+    # The object table of meaning texts is 8x the size of MEANING_CODE_TABLE,
+    # so it is only built for callers that still ask for it
+    if name == "MEANING_TABLE":
+        table = globals()["MEANING_TABLE"] = _frozen(MEANING_POOL[MEANING_CODE_TABLE])
+        return table
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# -----------------------------
+# Good Plot Index
+# -----------------------------
+GOOD_AREA_SET = frozenset(good_areas)
+GOOD_AREAS_SORTED = tuple(sorted(GOOD_AREA_SET))
+GOOD_AREA_MASK = np.zeros(GOOD_AREAS_SORTED[-1] + 1, dtype=bool)
+GOOD_AREA_MASK[list(GOOD_AREAS_SORTED)] = True
+GOOD_AREA_MASK = _frozen(GOOD_AREA_MASK)
+
+
+def is_good_area(area):
+    return area in GOOD_AREA_SET
+
+
+def is_good_area_batch(areas):
+    areas = np.asarray(areas, dtype=np.int64).reshape(-1)
+    in_range = (areas >= 0) & (areas < len(GOOD_AREA_MASK))
+    result = np.zeros(len(areas), dtype=bool)
+    result[in_range] = GOOD_AREA_MASK[areas[in_range]]
+    return result
+
+
+def nearest_good_area_above(area):
+    """
+    Returns the smallest good area strictly greater than area, or None.
+    """
+    i = bisect_right(GOOD_AREAS_SORTED, area)
+    return GOOD_AREAS_SORTED[i] if i < len(GOOD_AREAS_SORTED) else None
+
+
+def nearest_good_area_below(area):
+    """
+    Returns the largest good area strictly less than area, or None.
+    """
+    i = bisect_left(GOOD_AREAS_SORTED, area)
+    return GOOD_AREAS_SORTED[i - 1] if i > 0 else None
+
+
+def good_areas_between(lo, hi):
+    """
+    Returns all good areas in the inclusive range [lo, hi], in ascending order.
+    """
+    return GOOD_AREAS_SORTED[bisect_left(GOOD_AREAS_SORTED, lo):bisect_right(GOOD_AREAS_SORTED, hi)]
+
+
+# -----------------------------
+# Batch Engine
+# -----------------------------
+def period_index(areas):
+    return np.asarray(areas, dtype=np.int64).reshape(-1) % PERIOD
+
+
+def calculate_vastu_batch(areas):
+    """
+    Returns an (n, 16) matrix of varga values for an array of areas.
+    A zero remainder is replaced by the varga's divisor, as in calculate_vastu.
+    """
+    return VALUE_TABLE[period_index(areas)]
+
+
+def lookup_vastu_batch(areas):
+    """
+    Returns (values, verdicts, meanings) matrices for an array of areas,
+    each read from the periodic tables with one index per area.
+    """
+    idx = period_index(areas)
+    return VALUE_TABLE[idx], VERDICT_TABLE[idx], MEANING_POOL[MEANING_CODE_TABLE[idx]]
+
+
+def lookup_vastu(area):
+    idx = area % PERIOD
+    return VALUE_TABLE[idx], VERDICT_TABLE[idx], MEANING_POOL[MEANING_CODE_TABLE[idx]]
+
+
+def vastu_row_to_dict(row):
+    return {key: int(val) for key, val in zip(VARGA_KEYS, row)}
@@ -0,0 +1,93 @@
+import warnings
+from enum import IntEnum
+from typing import NamedTuple
+
+from .data import mul, div, meaning_map
+
+
+# -----------------------------
+# Structured meaning table
+# -----------------------------
+class Verdict(IntEnum):
+    NONE = 0
+    GOOD = 1
+    BAD = 2
+
+    @property
+    def label(self):
+        return VERDICT_LABELS[self]
+
+
+VERDICT_LABELS = ("-", "మంచిది", "మంచిదికాదు")
+_VERDICT_TOKENS = {VERDICT_LABELS[Verdict.GOOD]: Verdict.GOOD, VERDICT_LABELS[Verdict.BAD]: Verdict.BAD}
+_FACE_SUFFIX = "ముఖం"
+
+
+class Meaning(NamedTuple):
+    text: str
+    name: str
+    verdict: Verdict
+    face: str
+    effects: tuple
+
+
+def parse_meaning(text):
+    """
+    Splits a comma separated meaning such as
+    "ధ్వజాయము, మంచిది, పురుష ముఖం, ధనలాభం" into its name, verdict, face and effects.
+    """
+    tokens = [token.strip() for token in text.split(",") if token.strip()]
+    name = tokens[0] if tokens else ""
+    verdict, face, effects = Verdict.NONE, "", []
+    for token in tokens[1:]:
+        if token in _VERDICT_TOKENS:
+            verdict = _VERDICT_TOKENS[token]
+        elif not face and token.endswith(_FACE_SUFFIX):
+            face = token
+        else:
+            effects.append(token)
+    return Meaning(text, name, verdict, face, tuple(effects))
+
+
+def parse_meaning_map(meanings, multipliers, divisors):
+    """
+    Returns ({varga: {value: Meaning}}, issues) for the vargas in multipliers.
+    issues lists meaning keys that do not match a varga, vargas without
+    meanings and values a varga can never produce.
+    """
+    table, issues = {}, []
+    by_lower = {key.lower(): key for key in multipliers}
+    for key, entries in meanings.items():
+        if key not in multipliers:
+            hint = f" (did you mean '{by_lower[key.lower()]}'?)" if key.lower() in by_lower else ""
+            issues.append(f"meaning_map key '{key}' does not match any varga{hint}")
+            continue
+        table[key] = {value: parse_meaning(text) for value, text in entries.items()}
+        unreachable = sorted(value for value in entries if not 1 <= value <= divisors[key])
+        if unreachable:
+            issues.append(f"meaning_map['{key}'] has values outside 1..{divisors[key]}: {unreachable}")
+    for key in multipliers:
+        if key not in meanings:
+            issues.append(f"varga '{key}' has no meanings")
+    return table, tuple(issues)
+
+
+MEANINGS, MEANING_ISSUES = parse_meaning_map(meaning_map, mul, div)
+_issues_reported = False
+
+
+def warn_meaning_issues():
+    """
+    Warns once per process about each entry in MEANING_ISSUES. Entry points
+    call this; importing the package stays silent.
+    """
+    global _issues_reported
+    if _issues_reported:
+        return
+    _issues_reported = True
+    for issue in MEANING_ISSUES:
+        warnings.warn(issue, stacklevel=2)
+
+
+def get_meaning(varga, value):
+    return MEANINGS.get(varga, {}).get(value)
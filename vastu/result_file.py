@@ -0,0 +1,130 @@
+"""
+Fixed-width binary file of precomputed results for every area up to a maximum.
+
+Each record holds the 16 varga values, a good and a bad verdict bitmask (bit
+i is VARGA_KEYS[i]) and a flags byte whose lowest bit is good_areas
+membership. ResultFile maps the file read-only, so every process that opens
+it shares one page cache copy and slices come back as views without copying.
+
+    python -m vastu.result_file build results.bin --max-area 1000000
+"""
+import argparse
+import os
+import struct
+import sys
+
+import numpy as np
+
+from .engine import VARGA_KEYS, lookup_vastu_batch, is_good_area_batch
+from .meanings import Verdict
+
+MAGIC = b"VASTURES"
+VERSION = 1
+_HEADER = struct.Struct("<8sHHQ12x")  # magic, version, record size, max area, padding
+HEADER_SIZE = _HEADER.size
+
+RECORD_DTYPE = np.dtype([
+    ("vargas", np.uint8, (len(VARGA_KEYS),)),
+    ("good_mask", "<u2"),
+    ("bad_mask", "<u2"),
+    ("flags", np.uint8),
+])
+FLAG_GOOD_AREA = 1
+_BITS = (1 << np.arange(len(VARGA_KEYS))).astype(np.uint16)
+
+
+def build_records(areas):
+    """
+    Returns a RECORD_DTYPE array for an array of areas
+    """
+    values, verdicts, _ = lookup_vastu_batch(areas)
+    records = np.zeros(len(values), dtype=RECORD_DTYPE)
+    records["vargas"] = values
+    records["good_mask"] = ((verdicts == Verdict.GOOD) * _BITS).sum(axis=1)
+    records["bad_mask"] = ((verdicts == Verdict.BAD) * _BITS).sum(axis=1)
+    records["flags"] = np.where(is_good_area_batch(areas), FLAG_GOOD_AREA, 0)
+    return records
+
+
+def build_result_file(path, max_area, chunk_size=1 << 20):
+    """
+    Writes records for areas 0..max_area to path, chunk by chunk, replacing
+    any existing file atomically. Record i describes area i.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, RECORD_DTYPE.itemsize, max_area))
+        for start in range(0, max_area + 1, chunk_size):
+            areas = np.arange(start, min(start + chunk_size, max_area + 1), dtype=np.int64)
+            f.write(build_records(areas).tobytes())
+    os.replace(tmp_path, path)
+
+
+class ResultFile:
+    def __init__(self, path):
+        with open(path, "rb") as f:
+            magic, version, record_size, max_area = _HEADER.unpack(f.read(HEADER_SIZE))
+        if magic != MAGIC or version != VERSION or record_size != RECORD_DTYPE.itemsize:
+            raise ValueError(f"{path} is not a version {VERSION} vastu result file")
+        self.path = path
+        self.max_area = max_area
+        self.records = np.memmap(path, dtype=RECORD_DTYPE, mode="r",
+                                 offset=HEADER_SIZE, shape=(max_area + 1,))
+
+    def __len__(self):
+        return len(self.records)
+
+    def _check(self, lo, hi):
+        if lo < 0 or hi > self.max_area + 1:
+            raise IndexError(f"Areas {lo}..{hi - 1} outside 0..{self.max_area}")
+
+    def slice(self, lo, hi):
+        """
+        Returns the records for areas lo..hi-1 as a view into the mapping
+        """
+        self._check(lo, hi)
+        return self.records[lo:hi]
+
+    def vargas(self, lo, hi=None):
+        hi = lo + 1 if hi is None else hi
+        return self.slice(lo, hi)["vargas"]
+
+    def good_area(self, lo, hi=None):
+        hi = lo + 1 if hi is None else hi
+        return (self.slice(lo, hi)["flags"] & FLAG_GOOD_AREA).astype(bool)
+
+    def verdicts(self, lo, hi=None):
+        """
+        Decodes the verdict bitmasks of areas lo..hi-1 into Verdict codes
+        """
+        hi = lo + 1 if hi is None else hi
+        records = self.slice(lo, hi)
+        good = (records["good_mask"][:, None] & _BITS) != 0
+        bad = (records["bad_mask"][:, None] & _BITS) != 0
+        return np.where(good, Verdict.GOOD, np.where(bad, Verdict.BAD, Verdict.NONE)).astype(np.int8)
+
+    def take(self, areas):
+        """
+        Returns the records for an array of areas (a gathered copy)
+        """
+        areas = np.asarray(areas, dtype=np.int64)
+        if len(areas) and (areas.min() < 0 or areas.max() > self.max_area):
+            raise IndexError(f"Areas outside 0..{self.max_area}")
+        return self.records[areas]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build a memory-mappable vastu result file.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    build = sub.add_parser("build", help="write results for areas 0..max-area")
+    build.add_argument("path")
+    build.add_argument("--max-area", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+    build_result_file(args.path, args.max_area)
+    size = os.path.getsize(args.path)
+    print(f"Wrote {args.max_area + 1} records ({size / 1e6:.1f} MB) -> {args.path}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+import numpy as np
+from .engine import VARGA_KEYS, PERIOD, VALUE_TABLE, VERDICT_TABLE, GOOD_AREAS_SORTED
+from .meanings import Verdict
+
+# -----------------------------
+# Precomputed per-(varga, verdict) bitsets over one period
+# -----------------------------
+_VARGA_COLUMN = {key: col for col, key in enumerate(VARGA_KEYS)}
+_VERDICT_MASKS = tuple(VERDICT_TABLE == verdict for verdict in Verdict)
+for _mask in _VERDICT_MASKS:
+    _mask.setflags(write=False)
+
+_GOOD_AREAS = np.array(GOOD_AREAS_SORTED, dtype=np.int64)
+
+
+def _column(varga):
+    if varga not in _VARGA_COLUMN:
+        raise KeyError(f"Unknown varga '{varga}'. Expected one of: {', '.join(VARGA_KEYS)}")
+    return _VARGA_COLUMN[varga]
+
+
+def build_period_mask(values=None, verdicts=None):
+    """
+    Returns a boolean mask over area % PERIOD for the given constraints.
+    values:   {varga: iterable of allowed varga values}, e.g. {"aayam": {1, 3, 5, 7}}
+    verdicts: {varga: verdict code}, e.g. {"thithi": Verdict.GOOD}
+    """
+    mask = np.ones(PERIOD, dtype=bool)
+    for varga, allowed in (values or {}).items():
+        mask &= np.isin(VALUE_TABLE[:, _column(varga)], list(allowed))
+    for varga, verdict in (verdicts or {}).items():
+        mask &= _VERDICT_MASKS[verdict][:, _column(varga)]
+    return mask
+
+
+class AreaSearch:
+    """
+    All areas in [lo, hi] matching a constraint set, addressed by position.
+    Matches repeat every PERIOD, so counting and paging never scan the range.
+    """
+
+    def __init__(self, lo, hi, values=None, verdicts=None, good_only=False):
+        self.lo, self.hi = lo, hi
+        self.good_only = good_only
+        self._residues = np.flatnonzero(build_period_mask(values, verdicts))
+        if good_only:
+            candidates = _GOOD_AREAS[(_GOOD_AREAS >= lo) & (_GOOD_AREAS <= hi)]
+            self._good_matches = candidates[np.isin(candidates % PERIOD, self._residues)]
+        else:
+            self._start = self._matches_below(lo)
+            self._total = max(self._matches_below(hi + 1) - self._start, 0)
+
+    def _matches_below(self, area):
+        cycles, offset = divmod(area, PERIOD)
+        return cycles * len(self._residues) + int(np.searchsorted(self._residues, offset))
+
+    def __len__(self):
+        if self.good_only:
+            return len(self._good_matches)
+        return self._total
+
+    def slice(self, start, stop):
+        start, stop = max(start, 0), min(stop, len(self))
+        if start >= stop:
+            return np.empty(0, dtype=np.int64)
+        if self.good_only:
+            return self._good_matches[start:stop]
+        positions = np.arange(self._start + start, self._start + stop, dtype=np.int64)
+        cycles, offsets = np.divmod(positions, len(self._residues))
+        return cycles * PERIOD + self._residues[offsets]
+
+    def page(self, page, page_size=50):
+        return self.slice(page * page_size, (page + 1) * page_size)
+
+    def page_count(self, page_size=50):
+        return -(-len(self) // page_size)
+
+    def all(self):
+        return self.slice(0, len(self))
+
+
+def search_areas(lo, hi, values=None, verdicts=None, good_only=False):
+    """
+    Returns every area in [lo, hi] that satisfies the constraints, in ascending order.
+    """
+    return AreaSearch(lo, hi, values, verdicts, good_only).all()
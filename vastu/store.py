@@ -0,0 +1,203 @@
+"""
+SQLite store for computed reports, keyed by (village_letter, person_letter, area).
+
+The database runs in WAL mode so Streamlit sessions can read history while
+a batch job or another session writes. Each thread gets its own connection.
+Reports saved in bulk start with no views and stay out of the history until
+one is viewed.
+"""
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+from .calculations import calculate_money_expense, lookup_letter_value, money_expense_pairs
+from .engine import VARGA_KEYS, lookup_vastu, lookup_vastu_batch, is_good_area, is_good_area_batch
+
+# Next to the app, whatever directory it was launched from
+_APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_STORE_PATH = os.environ.get("VASTU_STORE_PATH", os.path.join(_APP_DIR, "vastu_reports.sqlite3"))
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    village_letter TEXT NOT NULL,
+    person_letter  TEXT NOT NULL,
+    area           INTEGER NOT NULL,
+    vargas         BLOB NOT NULL,
+    verdicts       BLOB NOT NULL,
+    money          INTEGER NOT NULL,
+    expense        INTEGER NOT NULL,
+    good_area      INTEGER NOT NULL,
+    created_at     REAL NOT NULL,
+    last_seen      REAL NOT NULL,
+    hits           INTEGER NOT NULL DEFAULT 1,
+    PRIMARY KEY (village_letter, person_letter, area)
+) WITHOUT ROWID;
+-- Bulk rows (hits = 0) are left out of the history index, so history
+-- pages never walk past them
+DROP INDEX IF EXISTS reports_last_seen;
+CREATE INDEX IF NOT EXISTS reports_viewed ON reports (last_seen DESC) WHERE hits > 0;
+CREATE INDEX IF NOT EXISTS reports_area ON reports (area);
+
+-- Number of viewed reports, kept up to date by the triggers below
+CREATE TABLE IF NOT EXISTS report_stats (
+    id     INTEGER PRIMARY KEY CHECK (id = 0),
+    viewed INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO report_stats (id, viewed) SELECT 0, COUNT(*) FROM reports WHERE hits > 0;
+CREATE TRIGGER IF NOT EXISTS reports_viewed_insert AFTER INSERT ON reports WHEN NEW.hits > 0
+BEGIN
+    UPDATE report_stats SET viewed = viewed + 1 WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS reports_viewed_update AFTER UPDATE OF hits ON reports
+WHEN OLD.hits = 0 AND NEW.hits > 0
+BEGIN
+    UPDATE report_stats SET viewed = viewed + 1 WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS reports_viewed_delete AFTER DELETE ON reports WHEN OLD.hits > 0
+BEGIN
+    UPDATE report_stats SET viewed = viewed - 1 WHERE id = 0;
+END;
+"""
+
+_COLUMNS = ("village_letter", "person_letter", "area", "vargas", "verdicts",
+            "money", "expense", "good_area", "created_at", "last_seen", "hits")
+
+
+def build_record(village_letter, person_letter, area):
+    """
+    Computes the stored fields for one report
+    """
+    values, verdicts, _ = lookup_vastu(area)
+    money, expense = calculate_money_expense(
+        lookup_letter_value(village_letter), lookup_letter_value(person_letter)
+    )
+    return {
+        "village_letter": village_letter,
+        "person_letter": person_letter,
+        "area": int(area),
+        "vargas": dict(zip(VARGA_KEYS, values.tolist())),
+        "verdicts": dict(zip(VARGA_KEYS, verdicts.tolist())),
+        "money": money,
+        "expense": expense,
+        "good_area": is_good_area(area),
+    }
+
+
+def _from_row(row):
+    record = dict(zip(_COLUMNS, row))
+    record["vargas"] = dict(zip(VARGA_KEYS, record["vargas"]))
+    record["verdicts"] = dict(zip(VARGA_KEYS, record["verdicts"]))
+    record["good_area"] = bool(record["good_area"])
+    return record
+
+
+class ReportStore:
+    def __init__(self, path=DEFAULT_STORE_PATH):
+        self.path = path
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, village_letter, person_letter, area):
+        row = self._connect().execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM reports "
+            "WHERE village_letter = ? AND person_letter = ? AND area = ?",
+            (village_letter, person_letter, int(area))
+        ).fetchone()
+        return _from_row(row) if row else None
+
+    def record_view(self, village_letter, person_letter, area):
+        """
+        Counts a view of a report for the history, computing and storing the
+        report on first use
+        """
+        now = time.time()
+        conn = self._connect()
+        with conn:
+            updated = conn.execute(
+                "UPDATE reports SET hits = hits + 1, last_seen = ? "
+                "WHERE village_letter = ? AND person_letter = ? AND area = ?",
+                (now, village_letter, person_letter, int(area))
+            ).rowcount
+            if not updated:
+                record = build_record(village_letter, person_letter, area)
+                conn.execute(
+                    f"INSERT OR IGNORE INTO reports ({', '.join(_COLUMNS)}) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)",
+                    (village_letter, person_letter, int(area),
+                     bytes(record["vargas"].values()), bytes(record["verdicts"].values()),
+                     record["money"], record["expense"], int(record["good_area"]), now, now)
+                )
+
+    def get_or_compute(self, village_letter, person_letter, area):
+        """
+        Returns the stored report, computing and storing it on first use.
+        Every call counts as a view for the history.
+        """
+        self.record_view(village_letter, person_letter, area)
+        return self.get(village_letter, person_letter, area)
+
+    def bulk_insert(self, village_letters, person_letters, areas):
+        """
+        Scores and stores row aligned arrays in one transaction. Rows with an
+        unknown letter are skipped and existing reports are left unchanged.
+        New reports have no views, so they are not part of the history.
+        Returns the number of rows written.
+        """
+        village_letters = np.asarray(village_letters, dtype=object)
+        person_letters = np.asarray(person_letters, dtype=object)
+        areas = np.asarray(areas, dtype=np.int64)
+        money, expense, known = money_expense_pairs(village_letters, person_letters)
+        values, verdicts, _ = lookup_vastu_batch(areas)
+        good = is_good_area_batch(areas)
+        now = time.time()
+        rows = (
+            (village_letters[i], person_letters[i], int(areas[i]),
+             values[i].tobytes(), verdicts[i].astype(np.uint8).tobytes(),
+             int(money[i]), int(expense[i]), int(good[i]), now, now)
+            for i in np.flatnonzero(known)
+        )
+        conn = self._connect()
+        with conn:
+            before = conn.total_changes
+            conn.executemany(
+                f"INSERT OR IGNORE INTO reports ({', '.join(_COLUMNS)}) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0)",
+                rows
+            )
+            return conn.total_changes - before
+
+    def count(self):
+        """
+        Returns the number of viewed reports, i.e. the length of the history
+        """
+        return self._connect().execute("SELECT viewed FROM report_stats WHERE id = 0").fetchone()[0]
+
+    def history(self, page=0, page_size=50):
+        """
+        Returns one page of viewed reports, most recently viewed first
+        """
+        rows = self._connect().execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM reports WHERE hits > 0 "
+            "ORDER BY last_seen DESC LIMIT ? OFFSET ?",
+            (page_size, page * page_size)
+        ).fetchall()
+        return [_from_row(row) for row in rows]
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -0,0 +1,119 @@
+"""
+Row builders, styling and HTML rendering for the results tables. pandas is
+imported only by the functions that return DataFrames or style them.
+
+The HTML renderers fill prebuilt row templates instead of going through a
+pandas Styler. Results repeat every PERIOD areas, so the varga table is
+memoized per area % PERIOD and the letter group table per letter.
+"""
+import html
+from functools import lru_cache
+
+from .calculations import get_letter_group_info
+from .engine import VARGA_KEYS, PERIOD, VALUE_TABLE, VERDICT_TABLE, MEANING_POOL, MEANING_CODE_TABLE, lookup_vastu
+from .meanings import VERDICT_LABELS
+
+
+def vastu_items(area):
+    """
+    Returns the 16 rows of the varga results table for an area
+    """
+    values, verdicts, meanings = lookup_vastu(area)
+    items = []
+    for key, val, verdict, meaning in zip(VARGA_KEYS, values, verdicts, meanings):
+        items.append({
+            "Vastu Item": key.capitalize(),
+            "Value": int(val),
+            "Meaning": meaning,
+            "Verdict": VERDICT_LABELS[verdict]
+        })
+    return items
+
+
+def money_expense_items(money, expense):
+    return {
+        "Item": ["ధనం", "వ్యయం"],
+        "Value": [money, expense]
+    }
+
+
+def style_vastu(row):
+    if row['Verdict'] == 'మంచిది':
+        return ['background-color: #c6f5d3'] * len(row)
+    elif row['Verdict'] == 'మంచిదికాదు':
+        return ['background-color: #f5c6c6'] * len(row)
+    else:
+        return ['background-color: #f0f0f0'] * len(row)
+
+
+def vastu_dataframe(area):
+    import pandas as pd
+
+    return pd.DataFrame(vastu_items(area))
+
+
+# -----------------------------
+# HTML rendering
+# -----------------------------
+def _table_head(columns):
+    cells = "".join(f"<th>{html.escape(column)}</th>" for column in columns)
+    return f'<table class="vastu-table"><thead><tr>{cells}</tr></thead><tbody>'
+
+
+_TABLE_END = "</tbody></table>"
+# Indexed by Verdict
+_ROW_CLASSES = ("plain-row", "good-row", "bad-row")
+_VASTU_HEAD = _table_head(("Vastu Item", "Value", "Meaning", "Verdict"))
+# One template per varga with the name already filled in
+_VASTU_ROWS = tuple(
+    '<tr class="{}"><td>' + html.escape(key.capitalize()) + "</td><td>{}</td><td>{}</td><td>{}</td></tr>"
+    for key in VARGA_KEYS
+)
+
+
+def html_table(rows, columns=None):
+    """
+    Renders a list of dicts (or a dict of columns) as a plain HTML table
+    """
+    if isinstance(rows, dict):
+        columns = list(rows) if columns is None else columns
+        rows = [dict(zip(columns, values)) for values in zip(*(rows[c] for c in columns))]
+    columns = list(rows[0]) if columns is None and rows else (columns or [])
+    body = "".join(
+        "<tr>" + "".join(f"<td>{html.escape(str(row[c]))}</td>" for c in columns) + "</tr>"
+        for row in rows
+    )
+    return _table_head(columns) + body + _TABLE_END
+
+
+@lru_cache(maxsize=PERIOD)
+def _vastu_table_html(residue):
+    rows = "".join(
+        template.format(_ROW_CLASSES[verdict], int(value), html.escape(meaning), VERDICT_LABELS[verdict])
+        for template, value, verdict, meaning
+        in zip(_VASTU_ROWS, VALUE_TABLE[residue], VERDICT_TABLE[residue],
+               MEANING_POOL[MEANING_CODE_TABLE[residue]])
+    )
+    return _VASTU_HEAD + rows + _TABLE_END
+
+
+def vastu_table_html(area):
+    """
+    Returns the 16-row varga results table for an area as HTML, with rows
+    classed good-row / bad-row / plain-row by verdict
+    """
+    return _vastu_table_html(int(area) % PERIOD)
+
+
+@lru_cache(maxsize=None)
+def letter_groups_html(letter):
+    """
+    Returns the rashi & nakshatram table for a letter as HTML, or "" when
+    the letter has no groups
+    """
+    groups = get_letter_group_info(letter)
+    return html_table(groups) if groups else ""
+
+
+def money_expense_html(money, expense):
+    return html_table(money_expense_items(money, expense))
@@ -0,0 +1,82 @@
+"""
+Leading akshara extraction for free-text Telugu names.
+
+A trie over the telugu_letters keys and every letter_variations form is
+walked one code point at a time, keeping the longest match, so multi code
+point letters such as "క్ష", "అం" or "కృ" resolve in a single pass without
+slicing the name.
+"""
+import numpy as np
+
+from .data import telugu_letters, letter_variations
+
+_END = ""  # key under which a trie node stores (letter, akshara)
+
+
+class LetterTrie:
+    __slots__ = ("_root",)
+
+    def __init__(self, entries):
+        """
+        entries: iterable of (akshara, letter) pairs, where letter is the
+        telugu_letters key the akshara scores as.
+        """
+        self._root = {}
+        for akshara, letter in entries:
+            node = self._root
+            for char in akshara:
+                node = node.setdefault(char, {})
+            node[_END] = (letter, akshara)
+
+    def match(self, text, start=0):
+        """
+        Returns (letter, akshara) for the longest entry at text[start:],
+        or (None, "") when no entry matches.
+        """
+        node, best = self._root, (None, "")
+        for i in range(start, len(text)):
+            node = node.get(text[i])
+            if node is None:
+                break
+            best = node.get(_END, best)
+        return best
+
+
+def build_letter_trie(letters=telugu_letters, variations=letter_variations):
+    entries = [(letter, letter) for letter in letters]
+    for letter, forms in variations.items():
+        entries.extend((form, letter) for form in forms if form != letter)
+    return LetterTrie(entries)
+
+
+LETTER_TRIE = build_letter_trie()
+
+
+def leading_akshara(name):
+    """
+    Returns (letter, akshara) for the start of name, skipping leading
+    whitespace, e.g. "కృష్ణ" -> ("క", "కృ"). letter is None if unknown.
+    """
+    start = 0
+    while start < len(name) and name[start].isspace():
+        start += 1
+    return LETTER_TRIE.match(name, start)
+
+
+def first_letters(names, cache=None):
+    """
+    Returns an object array with the leading telugu_letters key of every
+    name (None for unknown or missing names). Repeated names are matched
+    once; pass the same cache dict to reuse matches across calls.
+    """
+    seen = cache if cache is not None else {}
+    result = np.empty(len(names), dtype=object)
+    for i, name in enumerate(names):
+        if not isinstance(name, str):
+            # NaN and other missing values are never memoized
+            continue
+        letter = seen.get(name)
+        if letter is None and name not in seen:
+            letter = seen[name] = leading_akshara(name)[0]
+        result[i] = letter
+    return result